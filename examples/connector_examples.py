@@ -12,7 +12,8 @@ def openai_example():
     """Example using OpenAI connector with automatic tracing"""
     from ragtoolkit.connectors.openai import traced_openai_client
     
-    # Create client with automatic tracing
+    # Create client with automatic tracing (cached and backed by a shared
+    # keep-alive connection pool, so repeated calls reuse TLS sessions)
     client = traced_openai_client(api_key=os.getenv("OPENAI_API_KEY"))
     
     # Use normally - tracing happens automatically
@@ -32,7 +33,7 @@ def anthropic_example():
     """Example using Anthropic connector with automatic tracing"""
     from ragtoolkit.connectors.anthropic import traced_anthropic_client
     
-    # Create client with automatic tracing
+    # Create client with automatic tracing (cached, shared connection pool)
     client = traced_anthropic_client(api_key=os.getenv("ANTHROPIC_API_KEY"))
     
     # Use normally - tracing happens automatically
@@ -181,4 +182,8 @@ if __name__ == "__main__":
     # gemini_example()
     # ollama_example()
     
+    # Release pooled connections (also done automatically at exit)
+    from ragtoolkit.sdk.connectors import close_http_client
+    close_http_client()
+    
     print("✅ All examples completed. Check your RAG Toolkit dashboard!") 
\ No newline at end of file
@@ -7,9 +7,25 @@ RAG answer quality, safety, and cost.
 
 __version__ = "0.2.0"
 
+import importlib
+
 from .sdk.tracer import trace, RAGTracker, configure_tracker
-from .sdk import connectors
-from . import pinecone, weaviate
+
+# Integrations are imported on first attribute access (PEP 562)
+_LAZY_SUBMODULES = {
+    "connectors": ".sdk.connectors",
+    "pinecone": ".pinecone",
+    "weaviate": ".weaviate",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(_LAZY_SUBMODULES[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "trace", 
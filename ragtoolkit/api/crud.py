@@ -1,51 +1,225 @@
 """CRUD operations for RAG Toolkit database."""
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from uuid import UUID
+import io
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple
+from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy import Row, Integer, cast, extract, func, desc, and_, or_, insert, select, update, delete, bindparam, lambda_stmt, text, tuple_
 
 from .models import TraceRecord, EvaluationRecord, TraceCreate
 
 
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Convert an aware datetime to naive UTC, matching the stored timestamps.
+    
+    asyncpg rejects aware parameters for naive timestamp columns.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 class TraceCRUD:
     """CRUD operations for traces."""
     
+    # Unfiltered totals at or above this many traces are estimated
+    COUNT_ESTIMATE_THRESHOLD = 100_000
+    
+    @staticmethod
+    def _trace_values(trace_data: TraceCreate) -> Dict[str, Any]:
+        """Map an incoming trace to TraceRecord column values."""
+        return {
+            "trace_id": trace_data.trace_id,
+            # Stored as naive UTC like every other timestamp column, whatever
+            # the host's local timezone
+            "timestamp": datetime.fromtimestamp(trace_data.timestamp, timezone.utc).replace(tzinfo=None),
+            "user_input": trace_data.user_input,
+            "retrieved_chunks": trace_data.retrieved_chunks,
+            "retrieval_scores": trace_data.retrieval_scores,
+            "prompts": trace_data.prompts,
+            "model_output": trace_data.model_output,
+            "model_name": trace_data.model_name,
+            "response_latency_ms": trace_data.response_latency_ms,
+            "tokens_in": trace_data.tokens_in,
+            "tokens_out": trace_data.tokens_out,
+            "trace_metadata": trace_data.trace_metadata,
+            "error": trace_data.error
+        }
+    
     @staticmethod
     def create_trace(db: Session, trace_data: TraceCreate) -> TraceRecord:
-        """Create a new trace record."""
-        db_trace = TraceRecord(
-            trace_id=trace_data.trace_id,
-            timestamp=datetime.fromtimestamp(trace_data.timestamp),
-            user_input=trace_data.user_input,
-            retrieved_chunks=trace_data.retrieved_chunks,
-            retrieval_scores=trace_data.retrieval_scores,
-            prompts=trace_data.prompts,
-            model_output=trace_data.model_output,
-            model_name=trace_data.model_name,
-            response_latency_ms=trace_data.response_latency_ms,
-            tokens_in=trace_data.tokens_in,
-            tokens_out=trace_data.tokens_out,
-            trace_metadata=trace_data.trace_metadata,
-            error=trace_data.error
-        )
+        """
+        Create a new trace record.
+        
+        id and created_at are client-side defaults filled in on flush, so
+        the record is not refreshed; with expire_on_commit disabled its
+        attributes stay readable after the commit.
+        """
+        db_trace = TraceRecord(**TraceCRUD._trace_values(trace_data))
         
         db.add(db_trace)
         db.commit()
-        db.refresh(db_trace)
         return db_trace
     
+    @staticmethod
+    def bulk_create_traces(db: Session, traces: List[TraceCreate], batch_size: int = 500) -> List[str]:
+        """
+        Create many trace records with one multi-row INSERT per batch.
+        
+        On PostgreSQL (asyncpg or psycopg2) the rows are streamed with COPY
+        instead.
+        All batches are committed together; no records are refreshed.
+        
+        Returns:
+            The trace_ids of the created records, in input order
+        """
+        rows = [TraceCRUD._trace_values(trace) for trace in traces]
+        bind = db.get_bind()
+        
+        if rows and bind.dialect.name == "postgresql" and bind.dialect.driver in ("asyncpg", "psycopg2"):
+            TraceCRUD._copy_traces(db, rows)
+        else:
+            for start in range(0, len(rows), batch_size):
+                db.execute(insert(TraceRecord), rows[start:start + batch_size])
+            
+        db.commit()
+        return [trace.trace_id for trace in traces]
+    
+    @staticmethod
+    def _copy_traces(db: Session, rows: List[Dict[str, Any]]) -> None:
+        """Stream trace rows into PostgreSQL with COPY ... FROM STDIN."""
+        now = datetime.utcnow()
+        for row in rows:
+            row.update(id=uuid4(), created_at=now, updated_at=now)
+        
+        table = TraceRecord.__table__
+        dialect = db.get_bind().dialect
+        columns = list(rows[0])
+        # Column bind processors give the same values the INSERT path would,
+        # e.g. JSON columns serialized, with None stored as JSON null
+        processors = [table.c[column].type.bind_processor(dialect) for column in columns]
+        records = [
+            tuple(
+                process(row[column]) if process is not None else row[column]
+                for column, process in zip(columns, processors)
+            )
+            for row in rows
+        ]
+        
+        raw_connection = db.connection().connection
+        if dialect.driver == "asyncpg":
+            # asyncpg's binary COPY is a coroutine; run_async awaits it from
+            # this synchronous (run_sync) context
+            raw_connection.dbapi_connection.run_async(
+                lambda conn: conn.copy_records_to_table(table.name, records=records, columns=columns)
+            )
+            return
+        
+        # In CSV COPY an unquoted empty field is NULL and a quoted one is text
+        buffer = io.StringIO()
+        for record in records:
+            buffer.write(",".join(
+                "" if value is None else '"%s"' % str(value).replace('"', '""')
+                for value in record
+            ))
+            buffer.write("\n")
+        buffer.seek(0)
+        
+        cursor = raw_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        finally:
+            cursor.close()
+    
     @staticmethod
     def get_trace(db: Session, trace_id: str) -> Optional[TraceRecord]:
         """Get a trace by trace_id."""
-        return db.query(TraceRecord).filter(TraceRecord.trace_id == trace_id).first()
+        stmt = lambda_stmt(lambda: select(TraceRecord).where(TraceRecord.trace_id == trace_id))
+        return db.scalar(stmt)
+    
+    @staticmethod
+    def find_trace(db: Session, trace_id: str, trace_uuid: Optional[UUID] = None) -> Optional[TraceRecord]:
+        """
+        Get a trace by trace_id or, when given, by its database id.
+        
+        One query matching either column, for endpoints that accept both
+        identifiers in the same path parameter.
+        """
+        stmt = lambda_stmt(lambda: select(TraceRecord))
+        if trace_uuid is not None:
+            stmt += lambda s: s.where(or_(TraceRecord.id == trace_uuid, TraceRecord.trace_id == trace_id))
+        else:
+            stmt += lambda s: s.where(TraceRecord.trace_id == trace_id)
+        stmt += lambda s: s.limit(1)
+        return db.scalar(stmt)
+    
+    @staticmethod
+    def _apply_trace_filters(stmt: StatementLambdaElement,
+                             model_name: Optional[str] = None,
+                             traffic_light: Optional[str] = None,
+                             start_date: Optional[datetime] = None,
+                             end_date: Optional[datetime] = None,
+                             has_error: Optional[bool] = None) -> StatementLambdaElement:
+        """Add the list/count trace filters to a lambda statement."""
+        # Each filter is its own lambda rather than one where(*conds): lambda
+        # statements key their SQL cache on the code of every lambda applied,
+        # so each filter combination compiles once and is reused
+        start_date = _naive_utc(start_date)
+        end_date = _naive_utc(end_date)
+        if model_name:
+            stmt += lambda s: s.where(TraceRecord.model_name == model_name)
+        if traffic_light:
+            stmt += lambda s: s.where(TraceRecord.traffic_light == traffic_light)
+        if start_date:
+            stmt += lambda s: s.where(TraceRecord.timestamp >= start_date)
+        if end_date:
+            stmt += lambda s: s.where(TraceRecord.timestamp <= end_date)
+        if has_error is not None:
+            if has_error:
+                stmt += lambda s: s.where(TraceRecord.error.isnot(None))
+            else:
+                stmt += lambda s: s.where(TraceRecord.error.is_(None))
+        return stmt
     
     @staticmethod
-    def get_trace_by_uuid(db: Session, trace_uuid: UUID) -> Optional[TraceRecord]:
-        """Get a trace by UUID."""
-        return db.query(TraceRecord).filter(TraceRecord.id == trace_uuid).first()
+    def _list_stmt(stmt: StatementLambdaElement,
+                   skip: int,
+                   limit: int,
+                   model_name: Optional[str] = None,
+                   traffic_light: Optional[str] = None,
+                   start_date: Optional[datetime] = None,
+                   end_date: Optional[datetime] = None,
+                   has_error: Optional[bool] = None,
+                   before_timestamp: Optional[datetime] = None,
+                   before_id: Optional[UUID] = None) -> StatementLambdaElement:
+        """Add list filters, cursor and ordering to a lambda statement."""
+        stmt = TraceCRUD._apply_trace_filters(
+            stmt, model_name, traffic_light, start_date, end_date, has_error
+        )
+        
+        # Order by timestamp descending (newest first), id breaks ties
+        before_timestamp = _naive_utc(before_timestamp)
+        if before_timestamp is not None:
+            if before_id is not None:
+                # Row-value comparison is a single index range condition on
+                # (timestamp, id), unlike the equivalent OR form
+                stmt += lambda s: s.where(
+                    tuple_(TraceRecord.timestamp, TraceRecord.id) < tuple_(before_timestamp, before_id)
+                )
+            else:
+                stmt += lambda s: s.where(TraceRecord.timestamp < before_timestamp)
+            stmt += lambda s: s.order_by(desc(TraceRecord.timestamp), desc(TraceRecord.id)).limit(limit)
+        else:
+            stmt += lambda s: s.order_by(desc(TraceRecord.timestamp), desc(TraceRecord.id)).offset(skip).limit(limit)
+        
+        return stmt
     
     @staticmethod
     def list_traces(db: Session, 
@@ -55,29 +229,80 @@ class TraceCRUD:
                    traffic_light: Optional[str] = None,
                    start_date: Optional[datetime] = None,
                    end_date: Optional[datetime] = None,
-                   has_error: Optional[bool] = None) -> List[TraceRecord]:
-        """List traces with optional filtering."""
-        query = db.query(TraceRecord)
+                   has_error: Optional[bool] = None,
+                   before_timestamp: Optional[datetime] = None,
+                   before_id: Optional[UUID] = None) -> List[Row]:
+        """
+        List traces with optional filtering.
         
-        # Apply filters
-        if model_name:
-            query = query.filter(TraceRecord.model_name == model_name)
-        if traffic_light:
-            query = query.filter(TraceRecord.traffic_light == traffic_light)
-        if start_date:
-            query = query.filter(TraceRecord.timestamp >= start_date)
-        if end_date:
-            query = query.filter(TraceRecord.timestamp <= end_date)
-        if has_error is not None:
-            if has_error:
-                query = query.filter(TraceRecord.error.isnot(None))
-            else:
-                query = query.filter(TraceRecord.error.is_(None))
+        Returns Core rows (attribute access by column name) rather than ORM
+        instances, since callers only read and serialize them.
         
-        # Order by timestamp descending (newest first)
-        query = query.order_by(desc(TraceRecord.timestamp))
+        Pages are selected either by ``skip`` (OFFSET) or, when
+        ``before_timestamp`` is given, by seeking past the (timestamp, id)
+        of the last trace on the previous page. Seeking costs O(limit)
+        regardless of page depth; ``skip`` is ignored in that case.
+        """
+        stmt = TraceCRUD.list_traces_query(
+            skip, limit, model_name, traffic_light, start_date, end_date, has_error,
+            before_timestamp, before_id
+        )
+        return db.execute(stmt).all()
+    
+    @staticmethod
+    def list_traces_query(skip: int = 0,
+                          limit: int = 100,
+                          model_name: Optional[str] = None,
+                          traffic_light: Optional[str] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None,
+                          has_error: Optional[bool] = None,
+                          before_timestamp: Optional[datetime] = None,
+                          before_id: Optional[UUID] = None) -> StatementLambdaElement:
+        """
+        Build the list_traces statement without executing it.
         
-        return query.offset(skip).limit(limit).all()
+        For callers that stream the rows rather than fetch them all, e.g.
+        with AsyncSession.stream.
+        """
+        # Lambda statements cache their constructed SQL per filter combination;
+        # only the bound parameter values vary between calls
+        return TraceCRUD._list_stmt(
+            lambda_stmt(lambda: select(TraceRecord.__table__)),
+            skip, limit, model_name, traffic_light, start_date, end_date, has_error,
+            before_timestamp, before_id
+        )
+    
+    @staticmethod
+    def list_and_count_traces(db: Session,
+                              skip: int = 0,
+                              limit: int = 100,
+                              model_name: Optional[str] = None,
+                              traffic_light: Optional[str] = None,
+                              start_date: Optional[datetime] = None,
+                              end_date: Optional[datetime] = None,
+                              has_error: Optional[bool] = None) -> Tuple[List[Row], int]:
+        """
+        List a page of traces together with the total matching count.
+        
+        The total comes from COUNT(*) OVER () on the same scan as the page,
+        so list + count cost one query. Only a page past the end needs a
+        separate count. Rows are Core rows as from list_traces, plus the
+        total column.
+        """
+        stmt = TraceCRUD._list_stmt(
+            lambda_stmt(lambda: select(TraceRecord.__table__, func.count().over().label("total"))),
+            skip, limit, model_name, traffic_light, start_date, end_date, has_error
+        )
+        rows = db.execute(stmt).all()
+        
+        if rows:
+            return rows, rows[0].total
+        if skip == 0:
+            return [], 0
+        return [], TraceCRUD.count_traces(
+            db, model_name, traffic_light, start_date, end_date, has_error
+        )
     
     @staticmethod
     def count_traces(db: Session,
@@ -87,24 +312,36 @@ class TraceCRUD:
                     end_date: Optional[datetime] = None,
                     has_error: Optional[bool] = None) -> int:
         """Count traces with optional filtering."""
-        query = db.query(TraceRecord)
+        stmt = lambda_stmt(lambda: select(func.count()).select_from(TraceRecord))
+        stmt = TraceCRUD._apply_trace_filters(
+            stmt, model_name, traffic_light, start_date, end_date, has_error
+        )
         
-        # Apply same filters as list_traces
-        if model_name:
-            query = query.filter(TraceRecord.model_name == model_name)
-        if traffic_light:
-            query = query.filter(TraceRecord.traffic_light == traffic_light)
-        if start_date:
-            query = query.filter(TraceRecord.timestamp >= start_date)
-        if end_date:
-            query = query.filter(TraceRecord.timestamp <= end_date)
-        if has_error is not None:
-            if has_error:
-                query = query.filter(TraceRecord.error.isnot(None))
-            else:
-                query = query.filter(TraceRecord.error.is_(None))
+        return db.scalar(stmt)
+    
+    @staticmethod
+    def estimate_trace_count(db: Session) -> Optional[int]:
+        """
+        Estimate the total number of traces from PostgreSQL's table statistics.
+        
+        Reads pg_class.reltuples, which autovacuum/ANALYZE keep current,
+        instead of scanning the table with COUNT(*).
+        
+        Returns:
+            The estimate, or None on other databases, before the table has
+            been analyzed, or below COUNT_ESTIMATE_THRESHOLD, where an exact
+            count is cheap enough
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return None
         
-        return query.count()
+        estimate = db.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": TraceRecord.__tablename__}
+        )
+        if estimate is None or estimate < TraceCRUD.COUNT_ESTIMATE_THRESHOLD:
+            return None
+        return int(estimate)
     
     @staticmethod
     def update_trace_scores(db: Session, 
@@ -115,62 +352,170 @@ class TraceCRUD:
                            overall_score: Optional[float] = None,
                            traffic_light: Optional[str] = None) -> Optional[TraceRecord]:
         """Update evaluation scores for a trace."""
-        trace = db.query(TraceRecord).filter(TraceRecord.trace_id == trace_id).first()
-        if not trace:
-            return None
-            
-        if grounding_score is not None:
-            trace.grounding_score = grounding_score
-        if helpfulness_score is not None:
-            trace.helpfulness_score = helpfulness_score
-        if safety_score is not None:
-            trace.safety_score = safety_score
-        if overall_score is not None:
-            trace.overall_score = overall_score
-        if traffic_light is not None:
-            trace.traffic_light = traffic_light
-            
-        trace.updated_at = datetime.utcnow()
+        values = {
+            column: value
+            for column, value in (
+                ("grounding_score", grounding_score),
+                ("helpfulness_score", helpfulness_score),
+                ("safety_score", safety_score),
+                ("overall_score", overall_score),
+                ("traffic_light", traffic_light),
+            )
+            if value is not None
+        }
+        values["updated_at"] = datetime.utcnow()
+        
+        # One UPDATE ... RETURNING instead of SELECT, mutate, flush
+        trace = db.execute(
+            update(TraceRecord)
+            .where(TraceRecord.trace_id == trace_id)
+            .values(**values)
+            .returning(TraceRecord)
+        ).scalars().first()
         db.commit()
-        db.refresh(trace)
         return trace
     
     @staticmethod
-    def delete_old_traces(db: Session, days_to_keep: int = 30) -> int:
-        """Delete traces older than specified days."""
-        cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+    def bulk_update_trace_scores(db: Session, scores: List[Dict[str, Any]], commit: bool = True) -> int:
+        """
+        Update evaluation scores for many traces in one executemany UPDATE.
         
-        # First delete related evaluations
-        evaluation_count = db.query(EvaluationRecord).filter(
-            EvaluationRecord.evaluation_timestamp < cutoff_date
-        ).count()
+        Each dict needs a "trace_id" and may carry any of grounding_score,
+        helpfulness_score, safety_score, overall_score and traffic_light;
+        missing or None values leave the stored column unchanged. With
+        commit=False the update joins the caller's transaction.
         
-        db.query(EvaluationRecord).filter(
-            EvaluationRecord.evaluation_timestamp < cutoff_date
-        ).delete()
+        Returns:
+            Number of traces updated
+        """
+        if not scores:
+            return 0
+            
+        table = TraceRecord.__table__
+        score_columns = ["grounding_score", "helpfulness_score", "safety_score", "overall_score", "traffic_light"]
+        stmt = update(table).where(table.c.trace_id == bindparam("b_trace_id")).values(
+            updated_at=bindparam("b_updated_at"),
+            **{
+                column: func.coalesce(bindparam(f"b_{column}"), table.c[column])
+                for column in score_columns
+            }
+        )
         
-        # Then delete traces
-        trace_count = db.query(TraceRecord).filter(
-            TraceRecord.timestamp < cutoff_date
-        ).count()
+        now = datetime.utcnow()
+        params = [
+            {
+                "b_trace_id": row["trace_id"],
+                "b_updated_at": now,
+                **{f"b_{column}": row.get(column) for column in score_columns}
+            }
+            for row in scores
+        ]
         
-        db.query(TraceRecord).filter(
-            TraceRecord.timestamp < cutoff_date
-        ).delete()
+        result = db.execute(stmt, params)
+        if commit:
+            db.commit()
+        return result.rowcount
+    
+    @staticmethod
+    def delete_old_traces(db: Session,
+                          days_to_keep: int = 30,
+                          batch_size: int = 5000,
+                          pause_seconds: float = 0.01) -> int:
+        """
+        Delete traces older than specified days, with their evaluations.
         
-        db.commit()
-        return trace_count
+        Rows are deleted and committed in batches so locks and transaction
+        size stay bounded and ingestion can proceed between batches.
+        
+        Args:
+            db: Database session
+            days_to_keep: Age in days beyond which traces are deleted
+            batch_size: Maximum rows deleted per transaction
+            pause_seconds: Pause between batches
+            
+        Returns:
+            Number of traces deleted
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+        
+        deleted = 0
+        while True:
+            chunk = db.execute(
+                select(TraceRecord.id, TraceRecord.trace_id)
+                .where(TraceRecord.timestamp < cutoff_date)
+                .limit(batch_size)
+            ).all()
+            if not chunk:
+                return deleted
+                
+            # Evaluations are deleted explicitly: databases created before
+            # the ON DELETE CASCADE foreign key don't have it. No session
+            # synchronization, which would ship every deleted key back
+            db.execute(
+                delete(EvaluationRecord)
+                .where(EvaluationRecord.trace_id.in_([row.trace_id for row in chunk]))
+                .execution_options(synchronize_session=False)
+            )
+            # DELETE rowcounts replace a separate COUNT scan
+            count = db.execute(
+                delete(TraceRecord)
+                .where(TraceRecord.id.in_([row.id for row in chunk]))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            deleted += count
+            if len(chunk) < batch_size:
+                return deleted
+            time.sleep(pause_seconds)
     
     @staticmethod
-    def get_traces_for_evaluation(db: Session, limit: int = 100) -> List[TraceRecord]:
-        """Get traces that need evaluation (no scores yet)."""
-        return db.query(TraceRecord).filter(
+    def claim_traces_for_evaluation(db: Session,
+                                    limit: int = 100,
+                                    lease_seconds: float = 600,
+                                    max_attempts: int = 3) -> List[Row]:
+        """
+        Claim traces that need evaluation (no scores yet), as Core rows.
+        
+        Claimed traces get eval_claimed_at set, and the claim is committed
+        before returning, so scoring runs outside any transaction and holds
+        no row locks. Other claims skip the traces until lease_seconds have
+        passed, after which traces left unscored are claimed again, up to
+        max_attempts claims per trace. On
+        PostgreSQL, FOR UPDATE SKIP LOCKED keeps concurrent claims apart;
+        SQLite omits the clause.
+        
+        Rows carry only the columns the scorers read: trace_id, user_input,
+        model_output and retrieved_chunks.
+        """
+        now = datetime.utcnow()
+        pending = select(TraceRecord.id).where(
             and_(
                 TraceRecord.overall_score.is_(None),
                 TraceRecord.error.is_(None),  # Skip errored traces
-                TraceRecord.model_output.isnot(None)  # Must have output
+                TraceRecord.model_output.isnot(None),  # Must have output
+                TraceRecord.model_output != "",
+                TraceRecord.eval_attempts < max_attempts,
+                or_(
+                    TraceRecord.eval_claimed_at.is_(None),
+                    TraceRecord.eval_claimed_at < now - timedelta(seconds=lease_seconds)
+                )
             )
-        ).order_by(TraceRecord.timestamp).limit(limit).all()
+        ).order_by(TraceRecord.timestamp).limit(limit).with_for_update(skip_locked=True)
+        
+        rows = db.execute(
+            update(TraceRecord)
+            .where(TraceRecord.id.in_(pending.scalar_subquery()))
+            .values(eval_claimed_at=now, eval_attempts=TraceRecord.eval_attempts + 1)
+            .returning(
+                TraceRecord.trace_id,
+                TraceRecord.user_input,
+                TraceRecord.model_output,
+                TraceRecord.retrieved_chunks
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.commit()
+        return rows
 
 
 class EvaluationCRUD:
@@ -198,65 +543,171 @@ class EvaluationCRUD:
         
         db.add(db_evaluation)
         db.commit()
-        db.refresh(db_evaluation)
         return db_evaluation
     
     @staticmethod
-    def get_evaluations_for_trace(db: Session, trace_id: str) -> List[EvaluationRecord]:
-        """Get all evaluations for a specific trace."""
-        return db.query(EvaluationRecord).filter(
-            EvaluationRecord.trace_id == trace_id
-        ).order_by(EvaluationRecord.evaluation_timestamp).all()
+    def bulk_create_evaluations(db: Session,
+                                evaluations: List[Dict[str, Any]],
+                                batch_size: int = 500,
+                                commit: bool = True) -> int:
+        """
+        Create many evaluation records with one multi-row INSERT per batch.
+        
+        Each dict takes the same keys as create_evaluation's arguments.
+        With commit=False the inserts join the caller's transaction.
+        
+        Returns:
+            Number of evaluation records created
+        """
+        rows = [
+            {
+                "trace_id": evaluation["trace_id"],
+                "score_type": evaluation["score_type"],
+                "score": evaluation["score"],
+                "confidence": evaluation.get("confidence", 1.0),
+                "explanation": evaluation.get("explanation"),
+                "eval_metadata": evaluation.get("metadata") or {},
+                "evaluator_version": evaluation.get("evaluator_version")
+            }
+            for evaluation in evaluations
+        ]
+        
+        for start in range(0, len(rows), batch_size):
+            db.execute(insert(EvaluationRecord), rows[start:start + batch_size])
+            
+        if commit:
+            db.commit()
+        return len(rows)
+    
+    @staticmethod
+    def find_evaluations_for_trace(db: Session,
+                                   trace_id: str,
+                                   trace_uuid: Optional[UUID] = None) -> Optional[List[Row]]:
+        """
+        Get the evaluations of a trace looked up by trace_id or database id.
+        
+        The trace is outer-joined to its evaluations, so one query both
+        resolves the trace and fetches its evaluations; a trace without
+        evaluations still yields one row with NULL evaluation columns.
+        
+        Args:
+            db: Database session
+            trace_id: Trace identifier to match against trace_id
+            trace_uuid: Database id to match as well, when trace_id parses
+                as a UUID
+            
+        Returns:
+            The evaluations as Core rows, or None if no such trace exists
+        """
+        match = TraceRecord.trace_id == trace_id
+        if trace_uuid is not None:
+            match = or_(TraceRecord.id == trace_uuid, match)
+        
+        rows = db.execute(
+            select(EvaluationRecord.__table__)
+            .select_from(TraceRecord)
+            .outerjoin(EvaluationRecord, EvaluationRecord.trace_id == TraceRecord.trace_id)
+            .where(match)
+            .order_by(EvaluationRecord.evaluation_timestamp)
+        ).all()
+        if not rows:
+            return None
+        return [row for row in rows if row.id is not None]
 
 
 class StatsCRUD:
     """CRUD operations for statistics."""
     
+    DASHBOARD_CACHE_TTL = 5.0
+    TIME_SERIES_CACHE_TTL = 10.0
+    TIME_SERIES_CACHE_SIZE = 64
+    TOP_MODELS_WINDOW_DAYS = 7
+    
+    # (engine, expiry, stats) of the last dashboard computation
+    _dashboard_cache: Optional[Tuple[Any, float, Dict[str, Any]]] = None
+    
+    # (hours, bucket_size_minutes) -> (engine, expiry, data)
+    _time_series_cache: Dict[Tuple[int, int], Tuple[Any, float, List[Dict[str, Any]]]] = {}
+    
     @staticmethod
-    def get_dashboard_stats(db: Session) -> Dict[str, Any]:
-        """Get dashboard statistics."""
-        now = datetime.utcnow()
-        yesterday = now - timedelta(days=1)
+    def get_dashboard_stats(db: Session, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get dashboard statistics, reusing a result computed within the TTL.
+        
+        Dashboards poll this every few seconds while the totals change
+        slowly. No lock is taken here: under AsyncSession.run_sync a
+        blocking lock would stall the event loop, so callers that want to
+        coalesce concurrent refreshes serialize around this call.
+        
+        Args:
+            db: Database session
+            max_age: Seconds a cached result stays valid; defaults to
+                DASHBOARD_CACHE_TTL, 0 always recomputes
+            
+        Returns:
+            Dashboard statistics
+        """
+        ttl = StatsCRUD.DASHBOARD_CACHE_TTL if max_age is None else max_age
+        engine = db.get_bind()
         
-        # Total traces
-        total_traces = db.query(TraceRecord).count()
+        cached = StatsCRUD._dashboard_cache
+        if cached is not None and cached[0] is engine and cached[1] > time.monotonic():
+            return cached[2]
         
-        # Traces in last 24h
-        traces_24h = db.query(TraceRecord).filter(
-            TraceRecord.timestamp >= yesterday
-        ).count()
+        stats = StatsCRUD._compute_dashboard_stats(db)
+        StatsCRUD._dashboard_cache = (engine, time.monotonic() + ttl, stats)
+        return stats
+    
+    @staticmethod
+    def _compute_dashboard_stats(db: Session) -> Dict[str, Any]:
+        """Compute dashboard statistics."""
+        now = datetime.utcnow()
+        yesterday = now - timedelta(days=1)
         
-        # Average response time
-        avg_response_time = db.query(func.avg(TraceRecord.response_latency_ms)).filter(
-            TraceRecord.response_latency_ms.isnot(None)
-        ).scalar() or 0.0
+        # Counts, average latency and traffic lights in one scan; avg()
+        # already ignores NULL latencies
+        totals = db.execute(
+            select(
+                func.count().label("total_traces"),
+                func.count().filter(TraceRecord.timestamp >= yesterday).label("traces_24h"),
+                func.avg(TraceRecord.response_latency_ms).label("avg_response_time"),
+                func.count().filter(
+                    or_(
+                        TraceRecord.model_output.isnot(None),
+                        TraceRecord.error.isnot(None)
+                    )
+                ).label("total_with_output"),
+                func.count().filter(TraceRecord.error.isnot(None)).label("error_count"),
+                func.count().filter(TraceRecord.traffic_light == "green").label("green"),
+                func.count().filter(TraceRecord.traffic_light == "amber").label("amber"),
+                func.count().filter(TraceRecord.traffic_light == "red").label("red")
+            ).select_from(TraceRecord)
+        ).one()
         
-        # Traffic light distribution
-        traffic_light_stats = db.query(
-            TraceRecord.traffic_light,
-            func.count(TraceRecord.traffic_light)
-        ).filter(
-            TraceRecord.traffic_light.isnot(None)
-        ).group_by(TraceRecord.traffic_light).all()
+        total_traces = totals.total_traces
+        traces_24h = totals.traces_24h
+        avg_response_time = totals.avg_response_time or 0.0
         
         traffic_light_distribution = {
-            "green": 0,
-            "amber": 0, 
-            "red": 0
+            "green": totals.green,
+            "amber": totals.amber, 
+            "red": totals.red
         }
-        for light, count in traffic_light_stats:
-            traffic_light_distribution[light] = count
-        
-        # Top models
-        top_models = db.query(
-            TraceRecord.model_name,
-            func.count(TraceRecord.model_name).label('count'),
-            func.avg(TraceRecord.response_latency_ms).label('avg_latency')
-        ).filter(
-            TraceRecord.model_name.isnot(None)
-        ).group_by(TraceRecord.model_name).order_by(
-            desc('count')
-        ).limit(5).all()
+        
+        # Top models over the last week, so the cost tracks recent traffic
+        # rather than the whole table (served by ix_trace_model_ts)
+        top_models = db.execute(
+            select(
+                TraceRecord.model_name,
+                func.count(TraceRecord.model_name).label('count'),
+                func.avg(TraceRecord.response_latency_ms).label('avg_latency')
+            ).where(
+                TraceRecord.model_name.isnot(None),
+                TraceRecord.timestamp >= now - timedelta(days=StatsCRUD.TOP_MODELS_WINDOW_DAYS)
+            ).group_by(TraceRecord.model_name).order_by(
+                desc('count')
+            ).limit(5)
+        ).all()
         
         top_models_list = [
             {
@@ -268,16 +719,8 @@ class StatsCRUD:
         ]
         
         # Error rate
-        total_with_output = db.query(TraceRecord).filter(
-            or_(
-                TraceRecord.model_output.isnot(None),
-                TraceRecord.error.isnot(None)
-            )
-        ).count()
-        
-        error_count = db.query(TraceRecord).filter(
-            TraceRecord.error.isnot(None)
-        ).count()
+        total_with_output = totals.total_with_output
+        error_count = totals.error_count
         
         error_rate = (error_count / total_with_output * 100) if total_with_output > 0 else 0.0
         
@@ -293,42 +736,82 @@ class StatsCRUD:
     @staticmethod
     def get_time_series_data(db: Session, 
                            hours: int = 24,
-                           bucket_size_minutes: int = 60) -> List[Dict[str, Any]]:
-        """Get time series data for charts."""
+                           bucket_size_minutes: int = 60,
+                           max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get time series data for charts, reusing a result computed within the TTL.
+        
+        Args:
+            db: Database session
+            hours: Window to chart, ending now
+            bucket_size_minutes: Width of each bucket
+            max_age: Seconds a cached result stays valid; defaults to
+                TIME_SERIES_CACHE_TTL, 0 always recomputes
+            
+        Returns:
+            One entry per non-empty bucket, oldest first
+        """
+        ttl = StatsCRUD.TIME_SERIES_CACHE_TTL if max_age is None else max_age
+        engine = db.get_bind()
+        key = (hours, bucket_size_minutes)
+        now = time.monotonic()
+        
+        cache = StatsCRUD._time_series_cache
+        cached = cache.get(key)
+        if cached is not None and cached[0] is engine and cached[1] > now:
+            return cached[2]
+        
+        data = StatsCRUD._compute_time_series_data(db, hours, bucket_size_minutes)
+        if len(cache) >= StatsCRUD.TIME_SERIES_CACHE_SIZE:
+            # Drop expired windows; start over if dashboards use too many
+            for stale in [k for k, v in cache.items() if v[1] <= now]:
+                del cache[stale]
+            if len(cache) >= StatsCRUD.TIME_SERIES_CACHE_SIZE:
+                cache.clear()
+        cache[key] = (engine, now + ttl, data)
+        return data
+    
+    @staticmethod
+    def _compute_time_series_data(db: Session,
+                                  hours: int,
+                                  bucket_size_minutes: int) -> List[Dict[str, Any]]:
+        """Compute time series data for charts."""
         now = datetime.utcnow()
         start_time = now - timedelta(hours=hours)
+        bucket_seconds = bucket_size_minutes * 60
         
-        # This is a simplified version - in production you'd want proper time bucketing
-        traces = db.query(TraceRecord).filter(
-            TraceRecord.timestamp >= start_time
-        ).order_by(TraceRecord.timestamp).all()
-        
-        # Group by hour for simplicity
-        time_buckets = {}
-        for trace in traces:
-            hour = trace.timestamp.replace(minute=0, second=0, microsecond=0)
-            if hour not in time_buckets:
-                time_buckets[hour] = {
-                    "timestamp": hour,
-                    "count": 0,
-                    "avg_latency": 0,
-                    "error_count": 0,
-                    "traffic_lights": {"green": 0, "amber": 0, "red": 0}
-                }
-            
-            bucket = time_buckets[hour]
-            bucket["count"] += 1
-            
-            if trace.response_latency_ms:
-                bucket["avg_latency"] = (
-                    (bucket["avg_latency"] * (bucket["count"] - 1) + trace.response_latency_ms) 
-                    / bucket["count"]
-                )
-            
-            if trace.error:
-                bucket["error_count"] += 1
-                
-            if trace.traffic_light:
-                bucket["traffic_lights"][trace.traffic_light] += 1
+        # Bucket in the database so only one row per bucket is transferred;
+        # buckets are aligned to the epoch, so 60 minutes means whole hours
+        if db.get_bind().dialect.name == "postgresql":
+            epoch = func.floor(extract("epoch", TraceRecord.timestamp) / bucket_seconds) * bucket_seconds
+            bucket = func.timezone("UTC", func.to_timestamp(epoch))
+        else:
+            epoch = cast(func.strftime("%s", TraceRecord.timestamp), Integer) // bucket_seconds * bucket_seconds
+            bucket = func.datetime(epoch, "unixepoch")
+        bucket = bucket.label("bucket")
         
-        return list(time_buckets.values()) 
\ No newline at end of file
+        rows = db.execute(
+            select(
+                bucket,
+                func.count().label("count"),
+                func.avg(TraceRecord.response_latency_ms).label("avg_latency"),
+                func.count().filter(TraceRecord.error.isnot(None)).label("error_count"),
+                func.count().filter(TraceRecord.traffic_light == "green").label("green"),
+                func.count().filter(TraceRecord.traffic_light == "amber").label("amber"),
+                func.count().filter(TraceRecord.traffic_light == "red").label("red")
+            ).where(
+                TraceRecord.timestamp >= start_time
+            ).group_by(bucket).order_by(bucket)
+        )
+        
+        # Consume the result as it is fetched; no ORM instances are built
+        return [
+            {
+                "timestamp": row.bucket if isinstance(row.bucket, datetime) else datetime.fromisoformat(row.bucket),
+                "count": row.count,
+                "avg_latency": row.avg_latency or 0,
+                "error_count": row.error_count,
+                "traffic_lights": {"green": row.green, "amber": row.amber, "red": row.red}
+            }
+            for row in rows
+        ]
@@ -9,154 +9,390 @@ Provides endpoints for:
 """
 
 import os
+import re
+import atexit
+import tempfile
+import hmac
+import json
 import asyncio
+import hashlib
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Literal, Optional
 from contextlib import asynccontextmanager
+from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query
+import httpx
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateColumn
 
 from .models import Base, TraceCreate, TraceResponse, TraceListResponse, StatsResponse
 from .crud import TraceCRUD, EvaluationCRUD, StatsCRUD
 from ..sdk.evaluator import CompositeScorer
+from ..sdk.evaluator.models import TrafficLight
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when it is installed.
+    
+    Only used on routes without a response_model: those with one are already
+    serialized straight to bytes by Pydantic, which a custom response class
+    would disable.
+    """
+    
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
 
 
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ragtoolkit.db")
+AUTO_MIGRATE = os.getenv("RAGTOOLKIT_AUTO_MIGRATE", "1") != "0"
+
+
+def _async_database_url(url: str) -> str:
+    """Map a plain SQLite/PostgreSQL URL onto its asyncio driver."""
+    scheme, sep, rest = url.partition("://")
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if scheme in ("postgresql", "postgres", "postgresql+psycopg2"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
 
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
+    # An in-memory database exists only inside its one connection, and
+    # sessions interleaving on the event loop would share its transaction:
+    # one session's rollback on close would discard another's uncommitted
+    # writes. A temporary file, removed at exit, gives each session its own
+    # connection and transaction while keeping the database just as
+    # short-lived.
+    if ":memory:" in DATABASE_URL or DATABASE_URL.rstrip("/") == "sqlite:":
+        fd, _temp_database = tempfile.mkstemp(prefix="ragtoolkit-", suffix=".db")
+        os.close(fd)
+        
+        @atexit.register
+        def _remove_temp_database():
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(_temp_database + suffix)
+                except FileNotFoundError:
+                    pass
+        
+        DATABASE_URL = f"sqlite:///{_temp_database}"
+    
+    engine = create_async_engine(
+        _async_database_url(DATABASE_URL),
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        query_cache_size=1200,
     )
+    
+    # SQLite leaves foreign keys (and ON DELETE CASCADE) off unless asked.
+    # WAL lets readers proceed alongside the writer; NORMAL sync is durable
+    # in WAL mode short of power loss.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite_connection(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
 else:
-    engine = create_engine(DATABASE_URL)
-
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = create_async_engine(
+        _async_database_url(DATABASE_URL),
+        query_cache_size=1200,
+        pool_size=int(os.getenv("RAGTOOLKIT_DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("RAGTOOLKIT_DB_MAX_OVERFLOW", "20")),
+        pool_pre_ping=True,  # Drop connections the server closed while idle
+        pool_recycle=1800,
+    )
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# The CRUD layer stays synchronous and runs through AsyncSession.run_sync, so
+# database I/O awaits on the event loop instead of blocking it. Loaded
+# attributes are kept after commit so returned records never lazy-load.
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 # Security
 security = HTTPBearer(auto_error=False)
 API_KEY = os.getenv("RAGTOOLKIT_API_KEY")
+# Digest of the configured key, computed once; requests compare digests
+API_KEY_HASH = hashlib.blake2b(API_KEY.encode(), digest_size=16).digest() if API_KEY else None
 
 # Background evaluator
 evaluator = CompositeScorer()
 evaluation_task = None
-
-
-def get_db():
+EVALUATION_CONCURRENCY = int(os.getenv("RAGTOOLKIT_EVAL_CONCURRENCY", "8"))
+EVALUATION_BATCH_SIZE = int(os.getenv("RAGTOOLKIT_EVAL_BATCH_SIZE", "32"))
+# Seconds a claimed trace is left to its evaluator before others may claim it
+EVALUATION_LEASE_SECONDS = float(os.getenv("RAGTOOLKIT_EVAL_LEASE_SECONDS", "600"))
+# Claims per trace before the background evaluator gives up on it
+EVALUATION_MAX_ATTEMPTS = int(os.getenv("RAGTOOLKIT_EVAL_MAX_ATTEMPTS", "3"))
+# Set to 0 in API processes when the evaluator runs as its own worker
+RUN_EVALUATOR = os.getenv("RAGTOOLKIT_RUN_EVALUATOR", "1") != "0"
+# Keep-alive pool shared by the evaluator's LLM and moderation calls
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# Processes for CPU-bound scoring; 0 keeps it on the default thread pool
+EVALUATION_PROCESSES = int(os.getenv("RAGTOOLKIT_EVAL_PROCESSES", "0"))
+
+# Serializes dashboard stat computations; see get_stats
+dashboard_lock = asyncio.Lock()
+
+# (stats, etag) last served by get_stats, reused while the dashboard cache
+# keeps returning the same stats object
+stats_etag = (None, None)
+
+# Set when traces that need evaluation are ingested, waking the evaluator
+evaluation_pending = asyncio.Event()
+
+
+async def get_db():
     """Database dependency."""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Authentication dependency."""
     if API_KEY and credentials:
-        if credentials.credentials != API_KEY:
+        presented = hashlib.blake2b(credentials.credentials.encode(), digest_size=16).digest()
+        if not hmac.compare_digest(presented, API_KEY_HASH):
             raise HTTPException(status_code=401, detail="Invalid API key")
     elif API_KEY and not credentials:
         raise HTTPException(status_code=401, detail="API key required")
     return True
 
 
+async def save_scores(scores: List[dict], evaluations: List[dict]) -> int:
+    """
+    Write trace scores and their evaluations in one transaction.
+    
+    Traces whose scores are never written are claimed again once their
+    lease runs out, until EVALUATION_MAX_ATTEMPTS claims have been made.
+    
+    Returns:
+        Number of traces scored
+    """
+    if not scores:
+        return 0
+    async with SessionLocal() as db:
+        await db.run_sync(TraceCRUD.bulk_update_trace_scores, scores, commit=False)
+        await db.run_sync(EvaluationCRUD.bulk_create_evaluations, evaluations, commit=False)
+        await db.commit()
+    return len(scores)
+
+
 async def evaluate_traces_background():
     """Background task to evaluate traces."""
     while True:
+        batch_full = False
+        evaluation_pending.clear()
         try:
-            db = SessionLocal()
-            try:
-                # Get traces that need evaluation
-                traces = TraceCRUD.get_traces_for_evaluation(db, limit=10)
-                
-                for trace in traces:
-                    if not trace.model_output:
-                        continue
-                        
+            # Claim a batch in its own short transaction; scoring below runs
+            # with no transaction open and no rows locked
+            async with SessionLocal() as db:
+                traces = await db.run_sync(
+                    TraceCRUD.claim_traces_for_evaluation,
+                    limit=EVALUATION_BATCH_SIZE,
+                    lease_seconds=EVALUATION_LEASE_SECONDS,
+                    max_attempts=EVALUATION_MAX_ATTEMPTS
+                )
+            
+            # Score the batch concurrently so evaluator latency overlaps,
+            # with at most EVALUATION_CONCURRENCY calls in flight
+            semaphore = asyncio.Semaphore(EVALUATION_CONCURRENCY)
+            
+            async def score_trace(trace):
+                async with semaphore:
                     try:
-                        # Run evaluation
-                        composite_score = await evaluator.score(
+                        return trace, await evaluator.score(
                             answer=trace.model_output,
                             retrieved_chunks=trace.retrieved_chunks or [],
                             query=trace.user_input
                         )
-                        
-                        # Update trace with scores
-                        TraceCRUD.update_trace_scores(
-                            db,
-                            trace.trace_id,
-                            grounding_score=composite_score.grounding.score if composite_score.grounding else None,
-                            helpfulness_score=composite_score.helpfulness.score if composite_score.helpfulness else None,
-                            safety_score=composite_score.safety.score if composite_score.safety else None,
-                            overall_score=composite_score.overall_score,
-                            traffic_light=composite_score.overall_traffic_light.value
-                        )
-                        
-                        # Store detailed evaluations
-                        if composite_score.grounding:
-                            EvaluationCRUD.create_evaluation(
-                                db,
-                                trace.trace_id,
-                                "grounding",
-                                composite_score.grounding.score,
-                                composite_score.grounding.confidence,
-                                composite_score.grounding.explanation,
-                                composite_score.grounding.metadata
-                            )
-                            
-                        if composite_score.helpfulness:
-                            EvaluationCRUD.create_evaluation(
-                                db,
-                                trace.trace_id,
-                                "helpfulness", 
-                                composite_score.helpfulness.score,
-                                composite_score.helpfulness.confidence,
-                                composite_score.helpfulness.explanation,
-                                composite_score.helpfulness.metadata
-                            )
-                            
-                        if composite_score.safety:
-                            EvaluationCRUD.create_evaluation(
-                                db,
-                                trace.trace_id,
-                                "safety",
-                                composite_score.safety.score,
-                                composite_score.safety.confidence,
-                                composite_score.safety.explanation,
-                                composite_score.safety.metadata
-                            )
-                            
                     except Exception as e:
-                        print(f"Error evaluating trace {trace.trace_id}: {e}")
+                        logger.warning("Error evaluating trace %s: %s", trace.trace_id, e)
+                        return trace, None
+            
+            tasks = [asyncio.create_task(score_trace(trace)) for trace in traces]
+            scores = []
+            evaluations = []
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    trace, composite_score = await finished
+                    if composite_score is None:
                         continue
-                        
+                    
+                    scores.append({
+                        "trace_id": trace.trace_id,
+                        "grounding_score": composite_score.grounding.score if composite_score.grounding else None,
+                        "helpfulness_score": composite_score.helpfulness.score if composite_score.helpfulness else None,
+                        "safety_score": composite_score.safety.score if composite_score.safety else None,
+                        "overall_score": composite_score.overall_score,
+                        "traffic_light": composite_score.overall_traffic_light.value
+                    })
+                    
+                    # Detailed evaluations
+                    for score_type, result in (
+                        ("grounding", composite_score.grounding),
+                        ("helpfulness", composite_score.helpfulness),
+                        ("safety", composite_score.safety)
+                    ):
+                        if result:
+                            evaluations.append({
+                                "trace_id": trace.trace_id,
+                                "score_type": score_type,
+                                "score": result.score,
+                                "confidence": result.confidence,
+                                "explanation": result.explanation,
+                                "metadata": result.metadata
+                            })
+                    
+                    # Save scores EVALUATION_CONCURRENCY at a time as they
+                    # come in, so a crash or failed write redoes at most that
+                    # many rather than the whole batch
+                    if len(scores) >= EVALUATION_CONCURRENCY:
+                        await save_scores(scores, evaluations)
+                        scores, evaluations = [], []
+                await save_scores(scores, evaluations)
             finally:
-                db.close()
-                
+                for task in tasks:
+                    task.cancel()
+                    
+            # Claimed rows are leased whether or not they scored, so a full
+            # claim means more may be waiting
+            batch_full = len(traces) == EVALUATION_BATCH_SIZE
+            
         except Exception as e:
-            print(f"Error in evaluation background task: {e}")
+            logger.error("Error in evaluation background task: %s", e)
+            # Back off rather than re-claiming the same batch straight away
+            batch_full = False
             
-        # Wait before next batch
-        await asyncio.sleep(30)  # Check every 30 seconds
+        # Drain a backlog without pausing; otherwise sleep until new traces
+        # arrive, still polling every 30 seconds for traces ingested by
+        # other workers
+        if not batch_full:
+            try:
+                await asyncio.wait_for(evaluation_pending.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                pass
+
+
+# UUID in hyphenated or bare-hex form, optionally wrapped in braces or
+# prefixed with urn:uuid:; anything else can only be a trace_id
+_UUID_RE = re.compile(
+    r"^(?:urn:uuid:)?\{?"
+    r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+    r"\}?$"
+)
+
+
+def parse_trace_uuid(trace_id: str) -> Optional[UUID]:
+    """
+    Return the path id as a UUID when it could be a database id, else None.
+    
+    Accepts the forms UUID() parses in practice: hyphenated or bare hex,
+    any case, optionally in braces or with a urn:uuid: prefix.
+    """
+    return UUID(trace_id) if _UUID_RE.match(trace_id) else None
+
+
+def _add_missing_columns(connection):
+    """Add model columns that tables created by older versions lack."""
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ADD COLUMN "
+                    f"{CreateColumn(column).compile(dialect=connection.dialect)}"
+                ))
+
+
+async def create_tables():
+    """Create missing tables and columns, unless the schema is managed outside the app."""
+    # With several workers each one would otherwise repeat the checks
+    if AUTO_MIGRATE:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            # create_all leaves existing tables alone
+            await conn.run_sync(_add_missing_columns)
+
+
+def create_cpu_pool() -> Optional[ProcessPoolExecutor]:
+    """Create the process pool for CPU-bound scoring and hand it to the evaluator."""
+    if EVALUATION_PROCESSES <= 0:
+        return None
+    # Spawn rather than fork; forking a process with running threads is unsafe
+    pool = ProcessPoolExecutor(
+        max_workers=EVALUATION_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    evaluator.set_executor(pool)
+    return pool
+
+
+def shutdown_cpu_pool(pool: Optional[ProcessPoolExecutor]):
+    """Detach the process pool from the evaluator and stop its workers."""
+    if pool is not None:
+        evaluator.set_executor(None)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_evaluator_worker():
+    """
+    Run the background evaluator on its own, outside the API process.
+    
+    Scoring then no longer shares an event loop with request handling, and
+    evaluators scale separately from API workers. On PostgreSQL several
+    workers can run side by side, since claimed batches are leased and
+    skipped by the others; on SQLite run a single evaluator. Without ingestion in the same
+    process, new traces are picked up by the 30 second poll.
+    """
+    await create_tables()
+    cpu_pool = create_cpu_pool()
+    http = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=30.0)
+    evaluator.set_client(http)
+    try:
+        await evaluate_traces_background()
+    finally:
+        evaluator.set_client(None)
+        await http.aclose()
+        shutdown_cpu_pool(cpu_pool)
+        await engine.dispose()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan."""
+    await create_tables()
+    
+    # One pooled HTTP client for scoring, so LLM calls reuse connections
+    app.state.http = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=30.0)
+    evaluator.set_client(app.state.http)
+    
     # Start background evaluation task
     global evaluation_task
-    evaluation_task = asyncio.create_task(evaluate_traces_background())
+    app.state.cpu_pool = None
+    if RUN_EVALUATOR:
+        app.state.cpu_pool = create_cpu_pool()
+        evaluation_task = asyncio.create_task(evaluate_traces_background())
     
     yield
     
@@ -167,6 +403,9 @@ async def lifespan(app: FastAPI):
             await evaluation_task
         except asyncio.CancelledError:
             pass
+    shutdown_cpu_pool(app.state.cpu_pool)
+    evaluator.set_client(None)
+    await app.state.http.aclose()
 
 
 # FastAPI application
@@ -184,19 +423,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers reuse preflight results for a day
 )
 
 
+# Probe endpoints are polled constantly and never change, so their bodies
+# are encoded once
+ROOT_BODY = JSONResponse({"message": "RAG Toolkit API", "version": "0.2.0", "status": "healthy"}).body
+HEALTH_BODY = JSONResponse({"status": "healthy", "version": "0.2.0"}).body
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {"message": "RAG Toolkit API", "version": "0.2.0", "status": "healthy"}
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker."""
-    return {"status": "healthy", "version": "0.2.0"}
+    return Response(HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/api/config")
@@ -232,126 +478,172 @@ async def update_config(updates: dict):
 async def create_trace(
     trace: TraceCreate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
     """Create a new trace."""
     try:
-        db_trace = TraceCRUD.create_trace(db, trace)
+        db_trace = await db.run_sync(TraceCRUD.create_trace, trace)
+        if trace.model_output:
+            evaluation_pending.set()
         return {"message": "Trace created successfully", "trace_id": db_trace.trace_id}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.post("/api/v1/traces/batch", status_code=201)
+async def create_traces_batch(
+    traces: List[TraceCreate],
+    db: AsyncSession = Depends(get_db),
+    _: bool = Depends(get_current_user)
+):
+    """Create a batch of traces in one request."""
+    try:
+        trace_ids = await db.run_sync(TraceCRUD.bulk_create_traces, traces)
+        if any(trace.model_output for trace in traces):
+            evaluation_pending.set()
+        return {"message": f"Created {len(trace_ids)} traces", "trace_ids": trace_ids}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/api/v1/traces", response_model=TraceListResponse)
 async def list_traces(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     model_name: Optional[str] = None,
-    traffic_light: Optional[str] = None,
+    traffic_light: Optional[TrafficLight] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     has_error: Optional[bool] = None,
-    db: Session = Depends(get_db),
+    before_timestamp: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
-    """List traces with pagination and filtering."""
+    """
+    List traces with pagination and filtering.
+    
+    Pass the previous response's next_before_timestamp/next_before_id to
+    seek to the next page instead of using a deep page offset.
+    
+    With Accept: application/x-ndjson the traces are streamed one per line
+    and the paging fields are sent as X-* headers instead.
+    """
     skip = (page - 1) * size
     
-    traces = TraceCRUD.list_traces(
-        db, 
-        skip=skip, 
-        limit=size,
+    filters = dict(
         model_name=model_name,
-        traffic_light=traffic_light,
+        traffic_light=traffic_light.value if traffic_light else None,
         start_date=start_date,
         end_date=end_date,
         has_error=has_error
     )
     
-    total = TraceCRUD.count_traces(
-        db,
-        model_name=model_name,
-        traffic_light=traffic_light,
-        start_date=start_date,
-        end_date=end_date,
-        has_error=has_error
-    )
+    # An exact total over a large unfiltered table is a full scan per request;
+    # PostgreSQL's statistics give an estimate instead (None when not worth it)
+    estimated_total = None
+    if all(value is None for value in filters.values()):
+        estimated_total = await db.run_sync(TraceCRUD.estimate_trace_count)
+    
+    if estimated_total is not None:
+        traces = await db.run_sync(
+            TraceCRUD.list_traces,
+            skip=skip,
+            limit=size,
+            before_timestamp=before_timestamp,
+            before_id=before_id
+        )
+        total = estimated_total
+    elif before_timestamp is not None:
+        # The seek page and the filtered total are independent queries; the
+        # count gets its own session so the two round-trips overlap
+        async def count_traces():
+            async with SessionLocal() as count_db:
+                return await count_db.run_sync(TraceCRUD.count_traces, **filters)
+        
+        traces, total = await asyncio.gather(
+            db.run_sync(
+                TraceCRUD.list_traces,
+                limit=size,
+                before_timestamp=before_timestamp,
+                before_id=before_id,
+                **filters
+            ),
+            count_traces()
+        )
+    else:
+        # Page and total from one query
+        traces, total = await db.run_sync(TraceCRUD.list_and_count_traces, skip=skip, limit=size, **filters)
+    
+    if before_timestamp is not None or estimated_total is not None:
+        has_next = len(traces) == size
+    else:
+        has_next = (skip + size) < total
+    last = traces[-1] if has_next and traces else None
     
-    has_next = (skip + size) < total
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        headers = {"X-Total-Count": str(total), "X-Has-Next": "true" if has_next else "false"}
+        if estimated_total is not None:
+            headers["X-Total-Is-Estimate"] = "true"
+        if last:
+            headers["X-Next-Before-Timestamp"] = last.timestamp.isoformat()
+            headers["X-Next-Before-Id"] = str(last.id)
+        
+        # Each trace is serialized as it is sent rather than buffering the
+        # whole page
+        async def lines():
+            for trace in traces:
+                yield TraceResponse.model_validate(trace).model_dump_json() + "\n"
+        
+        return StreamingResponse(lines(), media_type="application/x-ndjson", headers=headers)
     
     return TraceListResponse(
-        traces=[TraceResponse.model_validate({
-            **trace.__dict__,
-            'id': str(trace.id)
-        }) for trace in traces],
+        traces=[TraceResponse.model_validate(trace) for trace in traces],
         total=total,
         page=page,
         size=size,
-        has_next=has_next
+        has_next=has_next,
+        total_is_estimate=estimated_total is not None,
+        next_before_timestamp=last.timestamp if last else None,
+        next_before_id=str(last.id) if last else None
     )
 
 
 @app.get("/api/v1/traces/{trace_id}", response_model=TraceResponse)
 async def get_trace(
     trace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
     """Get a specific trace by ID."""
-    # Try both lookup methods since both id and trace_id can be UUIDs
-    trace = None
-    
-    # First try looking up by database UUID (id field)
-    try:
-        from uuid import UUID
-        trace_uuid = UUID(trace_id)
-        trace = TraceCRUD.get_trace_by_uuid(db, trace_uuid)
-    except ValueError:
-        pass
-    
-    # If not found, try looking up by trace_id field
-    if not trace:
-        trace = TraceCRUD.get_trace(db, trace_id)
+    # The path may hold either the database id or the trace_id; one query
+    # matches both
+    trace_uuid = parse_trace_uuid(trace_id)
     
+    trace = await db.run_sync(TraceCRUD.find_trace, trace_id, trace_uuid)
     if not trace:
         raise HTTPException(status_code=404, detail="Trace not found")
     
-    return TraceResponse.model_validate({
-        **trace.__dict__,
-        'id': str(trace.id)
-    })
+    return TraceResponse.model_validate(trace)
 
 
-@app.get("/api/v1/traces/{trace_id}/evaluations")
+@app.get("/api/v1/traces/{trace_id}/evaluations", response_class=FastJSONResponse)
 async def get_trace_evaluations(
     trace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
     """Get all evaluations for a specific trace."""
-    # Find the trace using both lookup methods
-    trace = None
+    # The path may hold either the database id or the trace_id; both are
+    # matched by the same query that fetches the evaluations
+    trace_uuid = parse_trace_uuid(trace_id)
     
-    # First try looking up by database UUID (id field)
-    try:
-        from uuid import UUID
-        trace_uuid = UUID(trace_id)
-        trace = TraceCRUD.get_trace_by_uuid(db, trace_uuid)
-    except ValueError:
-        pass
-    
-    # If not found, try looking up by trace_id field
-    if not trace:
-        trace = TraceCRUD.get_trace(db, trace_id)
-    
-    if not trace:
+    evaluations = await db.run_sync(EvaluationCRUD.find_evaluations_for_trace, trace_id, trace_uuid)
+    if evaluations is None:
         raise HTTPException(status_code=404, detail="Trace not found")
     
-    # Use the actual trace_id from the database record
-    actual_trace_id = trace.trace_id
-    
-    evaluations = EvaluationCRUD.get_evaluations_for_trace(db, actual_trace_id)
     return [
         {
             "id": str(eval.id),
@@ -370,22 +662,38 @@ async def get_trace_evaluations(
 
 @app.get("/api/v1/stats", response_model=StatsResponse)
 async def get_stats(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
     """Get dashboard statistics."""
-    stats = StatsCRUD.get_dashboard_stats(db)
+    # Concurrent refreshes wait for the one in flight, then hit its cached result
+    async with dashboard_lock:
+        stats = await db.run_sync(StatsCRUD.get_dashboard_stats)
+    
+    # Let polling dashboards revalidate with If-None-Match and skip the body
+    global stats_etag
+    served_stats, etag = stats_etag
+    if served_stats is not stats:
+        etag = '"%s"' % hashlib.md5(json.dumps(stats, sort_keys=True).encode()).hexdigest()
+        stats_etag = (stats, etag)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
     return StatsResponse(**stats)
 
 
-@app.get("/api/v1/stats/timeseries")
+@app.get("/api/v1/stats/timeseries", response_class=FastJSONResponse)
 async def get_timeseries(
     hours: int = Query(24, ge=1, le=168),  # Max 1 week
-    db: Session = Depends(get_db),
+    bucket_minutes: int = Query(60, ge=1, le=1440),
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
     """Get time series data for charts."""
-    data = StatsCRUD.get_time_series_data(db, hours=hours)
+    data = await db.run_sync(StatsCRUD.get_time_series_data, hours=hours, bucket_size_minutes=bucket_minutes)
     return {"data": data}
 
 
@@ -393,25 +701,14 @@ async def get_timeseries(
 async def manual_evaluate_trace(
     trace_id: str,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
     """Manually trigger evaluation for a specific trace."""
-    # Find the trace using both lookup methods
-    trace = None
-    
-    # First try looking up by database UUID (id field) 
-    try:
-        from uuid import UUID
-        trace_uuid = UUID(trace_id)
-        trace = TraceCRUD.get_trace_by_uuid(db, trace_uuid)
-    except ValueError:
-        pass
-    
-    # If not found, try looking up by trace_id field
-    if not trace:
-        trace = TraceCRUD.get_trace(db, trace_id)
+    # The path may hold either the database id or the trace_id
+    trace_uuid = parse_trace_uuid(trace_id)
     
+    trace = await db.run_sync(TraceCRUD.find_trace, trace_id, trace_uuid)
     if not trace:
         raise HTTPException(status_code=404, detail="Trace not found")
     
@@ -427,18 +724,20 @@ async def manual_evaluate_trace(
                 query=trace.user_input
             )
             
-            # Update scores in database
-            TraceCRUD.update_trace_scores(
-                db,
-                trace.trace_id,
-                grounding_score=composite_score.grounding.score if composite_score.grounding else None,
-                helpfulness_score=composite_score.helpfulness.score if composite_score.helpfulness else None,
-                safety_score=composite_score.safety.score if composite_score.safety else None,
-                overall_score=composite_score.overall_score,
-                traffic_light=composite_score.overall_traffic_light.value
-            )
+            # Update scores in database; the request's session is closed by
+            # the time background tasks run
+            async with SessionLocal() as task_db:
+                await task_db.run_sync(
+                    TraceCRUD.update_trace_scores,
+                    trace.trace_id,
+                    grounding_score=composite_score.grounding.score if composite_score.grounding else None,
+                    helpfulness_score=composite_score.helpfulness.score if composite_score.helpfulness else None,
+                    safety_score=composite_score.safety.score if composite_score.safety else None,
+                    overall_score=composite_score.overall_score,
+                    traffic_light=composite_score.overall_traffic_light.value
+                )
         except Exception as e:
-            print(f"Manual evaluation failed for {trace_id}: {e}")
+            logger.warning("Manual evaluation failed for %s: %s", trace_id, e)
     
     background_tasks.add_task(evaluate_single_trace)
     
@@ -448,11 +747,13 @@ async def manual_evaluate_trace(
 @app.delete("/api/v1/traces/cleanup")
 async def cleanup_old_traces(
     days: int = Query(30, ge=1, le=365),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: bool = Depends(get_current_user)
 ):
     """Delete traces older than specified days."""
-    deleted_count = TraceCRUD.delete_old_traces(db, days_to_keep=days)
+    # No pause between batches: it would sleep on the event loop, and each
+    # batch's awaits already let other requests through
+    deleted_count = await db.run_sync(TraceCRUD.delete_old_traces, days_to_keep=days, pause_seconds=0)
     return {"message": f"Deleted {deleted_count} old traces", "days": days}
 
 
@@ -460,8 +761,7 @@ async def cleanup_old_traces(
 async def export_traces(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    format: str = Query("json", regex="^(json|csv)$"),
-    db: Session = Depends(get_db),
+    format: Literal["json", "csv"] = "json",
     _: bool = Depends(get_current_user)
 ):
     """Export traces for audit purposes."""
@@ -471,30 +771,49 @@ async def export_traces(
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
-    traces = TraceCRUD.list_traces(
-        db,
+    if format == "csv":
+        # CSV format would be implemented here
+        raise HTTPException(status_code=501, detail="CSV export not yet implemented")
+    
+    stmt = TraceCRUD.list_traces_query(
         start_date=start_date,
         end_date=end_date,
         limit=10000  # Large limit for export
     )
-    
-    if format == "json":
-        return {
-            "traces": [TraceResponse.model_validate({
-                **trace.__dict__,
-                'id': str(trace.id)
-            }).model_dump() for trace in traces],
-            "exported_at": datetime.utcnow(),
-            "date_range": {
-                "start": start_date,
-                "end": end_date
-            }
+    head = json.dumps({
+        "exported_at": datetime.utcnow().isoformat(),
+        "date_range": {
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat()
         }
-    else:
-        # CSV format would be implemented here
-        raise HTTPException(status_code=501, detail="CSV export not yet implemented")
+    })
+    
+    # Rows come from a server-side cursor in chunks and are encoded one at a
+    # time, so the export is never held in memory as a whole. The stream
+    # outlives the request's session, so it opens its own.
+    async def body():
+        yield (head[:-1] + ', "traces": [').encode()
+        async with SessionLocal() as stream_db:
+            result = await stream_db.stream(stmt, execution_options={"yield_per": 500})
+            separator = ""
+            async for trace in result:
+                yield (separator + TraceResponse.model_validate(trace).model_dump_json()).encode()
+                separator = ", "
+        yield b"]}"
+    
+    return StreamingResponse(body(), media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # uvloop and httptools ship with uvicorn[standard] ("auto" falls back to
+    # asyncio/h11 where they are unavailable); an import string is needed for
+    # more than one worker
+    uvicorn.run(
+        "ragtoolkit.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+    )
@@ -4,10 +4,10 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 from uuid import uuid4
 
-from sqlalchemy import Column, String, DateTime, Float, Integer, Text, Boolean, JSON
+from sqlalchemy import Column, String, DateTime, Float, Integer, Text, Boolean, JSON, Index, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 Base = declarative_base()
@@ -18,8 +18,8 @@ class TraceRecord(Base):
     __tablename__ = "traces"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    trace_id = Column(String(36), unique=True, nullable=False, index=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    trace_id = Column(String(36), nullable=False)
+    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Input data
     user_input = Column(Text)
@@ -46,10 +46,40 @@ class TraceRecord(Base):
     safety_score = Column(Float)
     overall_score = Column(Float)
     traffic_light = Column(String(10))  # green, amber, red
+    # When the background evaluator last claimed the trace for scoring, and
+    # how many times it has; traces that keep failing stop being claimed
+    eval_claimed_at = Column(DateTime)
+    eval_attempts = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Audit fields
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Unique trace_id lookup index for find_trace and the evaluations join;
+    # (timestamp, id) matching the unfiltered list order and its keyset cursor;
+    # indexes matching list_traces/count_traces filters with ORDER BY timestamp DESC;
+    # and a partial index holding only traces still waiting for evaluation
+    __table_args__ = (
+        Index("ux_trace_trace_id", trace_id, unique=True),
+        Index("ix_trace_ts_id", timestamp.desc(), id.desc()),
+        Index("ix_trace_model_ts", model_name, timestamp.desc()),
+        Index("ix_trace_tl_ts", traffic_light, timestamp.desc()),
+        Index(
+            "ix_trace_pending_eval",
+            timestamp,
+            postgresql_where=(overall_score.is_(None) & error.is_(None) & model_output.isnot(None)),
+            sqlite_where=(overall_score.is_(None) & error.is_(None) & model_output.isnot(None)),
+        ),
+        # Errored traces are a small slice; has_error=True listings and counts
+        # read just this index, already in page order
+        Index(
+            "ix_trace_error_ts",
+            timestamp.desc(),
+            id.desc(),
+            postgresql_where=error.isnot(None),
+            sqlite_where=error.isnot(None),
+        ),
+    )
 
 
 class EvaluationRecord(Base):
@@ -57,7 +87,7 @@ class EvaluationRecord(Base):
     __tablename__ = "evaluations"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    trace_id = Column(String(36), nullable=False, index=True)
+    trace_id = Column(String(36), ForeignKey("traces.trace_id", ondelete="CASCADE"), nullable=False)
     
     # Score details
     score_type = Column(String(20), nullable=False)  # grounding, helpfulness, safety, composite
@@ -69,6 +99,11 @@ class EvaluationRecord(Base):
     # Evaluation metadata
     evaluator_version = Column(String(50))
     evaluation_timestamp = Column(DateTime, default=datetime.utcnow)
+    
+    # Serves evaluation deletes by trace_id and find_evaluations_for_trace's join
+    __table_args__ = (
+        Index("ix_eval_trace_ts", trace_id, evaluation_timestamp),
+    )
 
 
 # Pydantic models for API requests/responses
@@ -118,6 +153,12 @@ class TraceResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @field_validator("id", mode="before")
+    @classmethod
+    def _stringify_id(cls, value: Any) -> Any:
+        """Accept the UUID primary key as loaded, so records validate directly."""
+        return value if isinstance(value, str) else str(value)
 
 
 class TraceListResponse(BaseModel):
@@ -127,6 +168,13 @@ class TraceListResponse(BaseModel):
     page: int
     size: int
     has_next: bool
+    
+    # Set when total is the planner's estimate for a large unfiltered table
+    total_is_estimate: bool = False
+    
+    # Keyset cursor for the next page (pass as before_timestamp/before_id)
+    next_before_timestamp: Optional[datetime] = None
+    next_before_id: Optional[str] = None
 
 
 class EvaluationResponse(BaseModel):
@@ -0,0 +1,132 @@
+"""Tests for RAG Toolkit CRUD statements."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.dialects import postgresql
+
+from ragtoolkit.api.crud import StatsCRUD
+
+
+def test_time_series_compiles_for_postgresql():
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    db.execute.return_value = []
+
+    assert StatsCRUD._compute_time_series_data(db, hours=24, bucket_size_minutes=60) == []
+
+    stmt = db.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "EXTRACT(epoch FROM traces.timestamp)" in sql
+
+
+def test_delete_old_traces_removes_evaluations_without_cascade():
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import create_engine, func, select
+    from sqlalchemy.orm import Session
+
+    from ragtoolkit.api.crud import TraceCRUD
+    from ragtoolkit.api.models import Base, EvaluationRecord, TraceRecord
+
+    # Plain SQLite leaves foreign keys off, like a database created before
+    # the ON DELETE CASCADE constraint existed
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    old = datetime.utcnow() - timedelta(days=60)
+    with Session(engine) as db:
+        for i in range(5):
+            trace_id = f"trace-{i}"
+            db.add(TraceRecord(trace_id=trace_id, timestamp=old if i < 3 else datetime.utcnow()))
+            db.add(EvaluationRecord(trace_id=trace_id, score_type="grounding", score=0.5))
+        db.commit()
+
+        assert TraceCRUD.delete_old_traces(db, days_to_keep=30, batch_size=2, pause_seconds=0) == 3
+
+        remaining = db.scalars(select(EvaluationRecord.trace_id).order_by(EvaluationRecord.trace_id)).all()
+        assert remaining == ["trace-3", "trace-4"]
+        assert db.scalar(select(func.count()).select_from(TraceRecord)) == 2
+
+
+def test_claim_traces_for_evaluation_leases_rows():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from ragtoolkit.api.crud import TraceCRUD
+    from ragtoolkit.api.models import Base, TraceRecord
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add(TraceRecord(trace_id="scorable", model_output="answer"))
+        db.add(TraceRecord(trace_id="empty", model_output=""))
+        db.add(TraceRecord(trace_id="errored", model_output="answer", error="boom"))
+        db.commit()
+
+        claimed = TraceCRUD.claim_traces_for_evaluation(db, limit=10, lease_seconds=600)
+        assert [row.trace_id for row in claimed] == ["scorable"]
+        assert not db.in_transaction()
+
+        # Leased rows are skipped until the lease runs out
+        assert TraceCRUD.claim_traces_for_evaluation(db, limit=10, lease_seconds=600) == []
+        assert len(TraceCRUD.claim_traces_for_evaluation(db, limit=10, lease_seconds=0)) == 1
+
+        # Traces that keep failing stop being claimed after max_attempts
+        assert TraceCRUD.claim_traces_for_evaluation(db, limit=10, lease_seconds=0, max_attempts=2) == []
+
+
+def test_list_traces_keyset_cursor_pages_through_ties():
+    from datetime import datetime
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from ragtoolkit.api.crud import TraceCRUD
+    from ragtoolkit.api.models import Base, TraceRecord
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    # Several traces share a timestamp, so the id has to break ties
+    timestamps = [datetime(2024, 1, 1, 12, minute) for minute in (0, 0, 0, 1, 1, 2, 3)]
+    with Session(engine) as db:
+        for i, timestamp in enumerate(timestamps):
+            db.add(TraceRecord(trace_id=f"trace-{i}", timestamp=timestamp))
+        db.commit()
+
+        expected = [row.trace_id for row in TraceCRUD.list_traces(db, limit=100)]
+        seen = []
+        page = TraceCRUD.list_traces(db, limit=3)
+        while page:
+            seen.extend(row.trace_id for row in page)
+            if len(page) < 3:
+                break
+            last = page[-1]
+            page = TraceCRUD.list_traces(db, limit=3, before_timestamp=last.timestamp, before_id=last.id)
+
+        assert seen == expected
+        assert len(seen) == len(timestamps)
+
+
+def test_list_filters_accept_aware_datetimes():
+    from datetime import datetime, timedelta, timezone
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from ragtoolkit.api.crud import TraceCRUD
+    from ragtoolkit.api.models import Base, TraceRecord
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add(TraceRecord(trace_id="early", timestamp=datetime(2024, 1, 1, 10)))
+        db.add(TraceRecord(trace_id="late", timestamp=datetime(2024, 1, 1, 12)))
+        db.commit()
+
+        # 13:00 at UTC+2 is 11:00 UTC
+        start = datetime(2024, 1, 1, 13, tzinfo=timezone(timedelta(hours=2)))
+        assert [row.trace_id for row in TraceCRUD.list_traces(db, start_date=start)] == ["late"]
+        assert [row.trace_id for row in TraceCRUD.list_traces(db, before_timestamp=start)] == ["early"]
@@ -176,6 +176,24 @@ def config(
     rprint("[green]Configuration updated[/green]")
 
 
+@app.command()
+def evaluator():
+    """
+    Run the background trace evaluator as a standalone worker.
+    
+    Uses the same DATABASE_URL and RAGTOOLKIT_EVAL_* settings as the API;
+    start the API with RAGTOOLKIT_RUN_EVALUATOR=0 so it does not evaluate
+    in-process as well.
+    """
+    from ..api.main import run_evaluator_worker
+    
+    rprint("[blue]Evaluating pending traces (Ctrl+C to stop)...[/blue]")
+    try:
+        asyncio.run(run_evaluator_worker())
+    except KeyboardInterrupt:
+        rprint("[yellow]Evaluator stopped[/yellow]")
+
+
 def load_test_cases(file: Path) -> List[Dict[str, Any]]:
     """Load test cases from CSV or JSONL file."""
     test_cases = []
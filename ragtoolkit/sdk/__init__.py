@@ -1,6 +1,17 @@
 """SDK components for RAG Toolkit."""
 
+import importlib
+
 from .tracer import trace, RAGTracker
-from . import connectors
+
+
+def __getattr__(name):
+    # Connectors are imported on first access (PEP 562)
+    if name == "connectors":
+        module = importlib.import_module(".connectors", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["trace", "RAGTracker", "connectors"] 
\ No newline at end of file
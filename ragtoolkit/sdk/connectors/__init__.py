@@ -8,5 +8,6 @@ from .openai import ChatCompletion
 from .anthropic import Complete  
 from .gemini import Chat
 from .ollama import Llama
+from .pool import get_http_client, close_http_client
 
-__all__ = ['ChatCompletion', 'Complete', 'Chat', 'Llama'] 
\ No newline at end of file
+__all__ = ['ChatCompletion', 'Complete', 'Chat', 'Llama', 'get_http_client', 'close_http_client'] 
\ No newline at end of file
@@ -7,7 +7,8 @@ Wraps Anthropic client with automatic tracing capabilities.
 import functools
 import time
 from typing import Any, Dict, Optional, Union, List
-from ..tracer import RAGTracker
+from ..tracer import get_global_tracker
+from .pool import cached_client, get_http_client
 
 
 def with_tracing(func):
@@ -19,7 +20,7 @@ def with_tracing(func):
         model = kwargs.get('model', getattr(self, 'model', 'claude-3-sonnet-20240229'))
         
         # Start tracing
-        tracker = RAGTracker()
+        tracker = get_global_tracker()
         
         # Extract user input from messages
         user_input = None
@@ -118,7 +119,10 @@ class Complete:
 
 def traced_anthropic_client(api_key: Optional[str] = None, **kwargs):
     """
-    Create a new Anthropic client with tracing enabled.
+    Create an Anthropic client with tracing enabled.
+    
+    The client shares the connectors' keep-alive connection pool. Calls
+    without extra client options return the same cached client per API key.
     
     Args:
         api_key: Anthropic API key
@@ -132,5 +136,11 @@ def traced_anthropic_client(api_key: Optional[str] = None, **kwargs):
     except ImportError:
         raise ImportError("anthropic package is required. Install with: pip install anthropic")
     
-    client = Anthropic(api_key=api_key, **kwargs)
-    return Complete.wrap_client(client) 
\ No newline at end of file
+    if kwargs:
+        kwargs.setdefault("http_client", get_http_client("anthropic"))
+        return Complete.wrap_client(Anthropic(api_key=api_key, **kwargs))
+    
+    return cached_client(
+        ("anthropic", api_key),
+        lambda: Complete.wrap_client(Anthropic(api_key=api_key, http_client=get_http_client("anthropic")))
+    ) 
\ No newline at end of file
@@ -7,7 +7,8 @@ Wraps Google Gemini API with automatic tracing capabilities.
 import functools
 import time
 from typing import Any, Dict, Optional, Union, List
-from ..tracer import RAGTracker
+from ..tracer import get_global_tracker
+from .pool import cached_client
 
 
 def with_tracing(func):
@@ -31,7 +32,7 @@ def with_tracing(func):
         model = getattr(self, 'model_name', 'gemini-pro')
         
         # Start tracing
-        tracker = RAGTracker()
+        tracker = get_global_tracker()
         
         with tracker.trace_context(user_input=user_input or 'Gemini API call') as trace:
             # Add prompt
@@ -130,7 +131,10 @@ class Chat:
 
 def traced_gemini_model(model_name: str = 'gemini-pro', api_key: Optional[str] = None, **kwargs):
     """
-    Create a new Gemini model with tracing enabled.
+    Create a Gemini model with tracing enabled.
+    
+    Calls without extra model options return the same cached model per
+    model name and API key, so its underlying transport is reused.
     
     Args:
         model_name: Gemini model name (default: 'gemini-pro')
@@ -148,5 +152,10 @@ def traced_gemini_model(model_name: str = 'gemini-pro', api_key: Optional[str] =
     if api_key:
         genai.configure(api_key=api_key)
     
-    model = genai.GenerativeModel(model_name, **kwargs)
-    return Chat.wrap_model(model) 
\ No newline at end of file
+    if kwargs:
+        return Chat.wrap_model(genai.GenerativeModel(model_name, **kwargs))
+    
+    return cached_client(
+        ("gemini", model_name, api_key),
+        lambda: Chat.wrap_model(genai.GenerativeModel(model_name))
+    ) 
\ No newline at end of file
@@ -7,7 +7,8 @@ Wraps Ollama client with automatic tracing capabilities.
 import functools
 import time
 from typing import Any, Dict, Optional, Union, List
-from ..tracer import RAGTracker
+from ..tracer import get_global_tracker
+from .pool import cached_client
 
 
 def with_tracing(func):
@@ -20,7 +21,7 @@ def with_tracing(func):
         messages = kwargs.get('messages', [])
         
         # Start tracing
-        tracker = RAGTracker()
+        tracker = get_global_tracker()
         
         # Extract user input
         user_input = prompt
@@ -139,7 +140,10 @@ class Llama:
 
 def traced_ollama_client(host: Optional[str] = None, **kwargs):
     """
-    Create a new Ollama client with tracing enabled.
+    Create an Ollama client with tracing enabled.
+    
+    Calls without extra client options return the same cached client per
+    host, so its keep-alive connections are reused.
     
     Args:
         host: Ollama server host (default: http://localhost:11434)
@@ -153,8 +157,14 @@ def traced_ollama_client(host: Optional[str] = None, **kwargs):
     except ImportError:
         raise ImportError("ollama package is required. Install with: pip install ollama")
     
-    client = ollama.Client(host=host, **kwargs) if host else ollama.Client(**kwargs)
-    return Llama.wrap_client(client)
+    if kwargs:
+        client = ollama.Client(host=host, **kwargs) if host else ollama.Client(**kwargs)
+        return Llama.wrap_client(client)
+    
+    return cached_client(
+        ("ollama", host),
+        lambda: Llama.wrap_client(ollama.Client(host=host) if host else ollama.Client())
+    )
 
 
 # Convenience functions for direct usage
@@ -7,7 +7,8 @@ Wraps OpenAI client with automatic tracing capabilities.
 import functools
 import time
 from typing import Any, Dict, Optional, Union, List
-from ..tracer import RAGTracker
+from ..tracer import get_global_tracker
+from .pool import cached_client, get_http_client
 
 
 def with_tracing(func):
@@ -19,7 +20,7 @@ def with_tracing(func):
         model = kwargs.get('model', getattr(self, 'model', 'gpt-3.5-turbo'))
         
         # Start tracing
-        tracker = RAGTracker()
+        tracker = get_global_tracker()
         
         # Extract user input from messages
         user_input = None
@@ -108,7 +109,10 @@ class ChatCompletion:
 
 def traced_openai_client(api_key: Optional[str] = None, **kwargs):
     """
-    Create a new OpenAI client with tracing enabled.
+    Create an OpenAI client with tracing enabled.
+    
+    The client shares the connectors' keep-alive connection pool. Calls
+    without extra client options return the same cached client per API key.
     
     Args:
         api_key: OpenAI API key
@@ -122,5 +126,11 @@ def traced_openai_client(api_key: Optional[str] = None, **kwargs):
     except ImportError:
         raise ImportError("openai package is required. Install with: pip install openai")
     
-    client = OpenAI(api_key=api_key, **kwargs)
-    return ChatCompletion.wrap_client(client) 
\ No newline at end of file
+    if kwargs:
+        kwargs.setdefault("http_client", get_http_client("openai"))
+        return ChatCompletion.wrap_client(OpenAI(api_key=api_key, **kwargs))
+    
+    return cached_client(
+        ("openai", api_key),
+        lambda: ChatCompletion.wrap_client(OpenAI(api_key=api_key, http_client=get_http_client("openai")))
+    ) 
\ No newline at end of file
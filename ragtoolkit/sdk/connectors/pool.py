@@ -0,0 +1,134 @@
+"""
+Shared HTTP connection pool for RAG Toolkit connectors.
+
+OpenAI and Anthropic clients built by the ``traced_*`` factories reuse a
+keep-alive ``httpx.Client`` per provider so repeated calls skip the TCP/TLS
+handshake. Each is the SDK's own ``DefaultHttpxClient``, so the SDK's
+timeouts and redirect handling are kept. The Gemini and Ollama SDKs don't
+accept an HTTP client and keep their own connections.
+"""
+
+import atexit
+import threading
+import logging
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=16,
+    max_connections=32,
+    keepalive_expiry=60,
+)
+
+PROVIDER_URLS = {
+    "openai": "https://api.openai.com",
+    "anthropic": "https://api.anthropic.com",
+}
+
+_http_clients: Dict[str, httpx.Client] = {}
+_clients: Dict[Hashable, Any] = {}
+_lock = threading.RLock()
+
+
+def _new_http_client(provider: str) -> Optional[httpx.Client]:
+    """Build a pooled client with the provider SDK's own defaults."""
+    try:
+        if provider == "openai":
+            from openai import DefaultHttpxClient
+        elif provider == "anthropic":
+            from anthropic import DefaultHttpxClient
+        else:
+            raise ValueError(f"No shared HTTP client for provider: {provider}")
+    except ImportError:
+        # Missing or too old to export it; the SDK then builds its own client
+        return None
+    return DefaultHttpxClient(limits=POOL_LIMITS)
+
+
+def get_http_client(provider: str) -> Optional[httpx.Client]:
+    """
+    Get the shared keep-alive HTTP client for a provider SDK, creating it on first use.
+    
+    Args:
+        provider: "openai" or "anthropic"
+        
+    Returns:
+        The pooled client, or None when the installed SDK can't supply one
+    """
+    client = _http_clients.get(provider)
+    if client is None or client.is_closed:
+        with _lock:
+            client = _http_clients.get(provider)
+            if client is None or client.is_closed:
+                client = _new_http_client(provider)
+                if client is None:
+                    return None
+                _http_clients[provider] = client
+    return client
+
+
+def cached_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Get the provider client cached under ``key``, building it on first use.
+
+    Args:
+        key: Cache key identifying the client configuration
+        factory: Callable that builds the traced client
+
+    Returns:
+        Cached traced client
+    """
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = factory()
+                _clients[key] = client
+    return client
+
+
+def prewarm_connections(providers: Iterable[str]) -> threading.Thread:
+    """
+    Open pooled TLS connections to LLM providers on a background thread.
+    
+    Args:
+        providers: Provider names from PROVIDER_URLS; others are skipped,
+            since their SDKs don't use the shared pool
+        
+    Returns:
+        The started daemon thread
+    """
+    providers = list(providers)
+    
+    def _prewarm():
+        for provider in providers:
+            if provider not in PROVIDER_URLS:
+                logger.debug(f"Skipping pre-warm for {provider}: its SDK doesn't use the shared pool")
+                continue
+            try:
+                client = get_http_client(provider)
+                if client is not None:
+                    client.head(PROVIDER_URLS[provider], timeout=2.0)
+            except Exception as e:
+                logger.debug(f"Pre-warming {provider} failed: {e}")
+    
+    thread = threading.Thread(target=_prewarm, name="ragtoolkit-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP clients and drop cached provider clients."""
+    with _lock:
+        _clients.clear()
+        for client in _http_clients.values():
+            client.close()
+        _http_clients.clear()
+
+
+atexit.register(close_http_client)
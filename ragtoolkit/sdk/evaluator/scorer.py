@@ -10,10 +10,12 @@ Implements the three core evaluation metrics:
 import asyncio
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from typing import Dict, List, Optional, Any
 import logging
 
 import httpx
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
@@ -24,6 +26,31 @@ from .models import ScoreResult, ScoreType, CompositeScore
 logger = logging.getLogger(__name__)
 
 
+def _tfidf_overlap(vectorizer: TfidfVectorizer, answer: str, chunks: List[str]) -> float:
+    """
+    Maximum TF-IDF cosine similarity between the answer and any chunk.
+    
+    Module-level so it can be sent to a process pool; the vectorizer is
+    fitted in place, so callers pass an unfitted copy.
+    """
+    try:
+        all_texts = [answer] + chunks
+        tfidf_matrix = vectorizer.fit_transform(all_texts)
+        
+        # Calculate similarity between answer and each chunk
+        answer_vector = tfidf_matrix[0]
+        chunk_vectors = tfidf_matrix[1:]
+        
+        similarities = cosine_similarity(answer_vector, chunk_vectors)[0]
+        
+        # Return maximum similarity
+        return float(np.max(similarities)) if len(similarities) > 0 else 0.0
+        
+    except Exception as e:
+        logger.warning(f"Error calculating overlap score: {e}")
+        return 0.0
+
+
 class BaseScorer(ABC):
     """Base class for all scorers."""
     
@@ -41,11 +68,15 @@ class GroundingScorer(BaseScorer):
     """
     Evaluates how well the answer is grounded in the retrieved context.
     Uses TF-IDF cosine similarity and citation overlap.
+    
+    The TF-IDF step is CPU-bound, so it runs in ``executor`` (the event
+    loop's default thread pool when None) instead of on the event loop.
     """
     
-    def __init__(self, threshold: float = 0.3):
+    def __init__(self, threshold: float = 0.3, executor: Optional[Executor] = None):
         self.threshold = threshold
         self.vectorizer = TfidfVectorizer(stop_words='english', lowercase=True)
+        self.executor = executor
         
     def _extract_citations(self, text: str) -> List[str]:
         """Extract potential citations/quotes from text."""
@@ -56,27 +87,16 @@ class GroundingScorer(BaseScorer):
         citations.extend(re.findall(r"'([^']*)'", text))
         return [c.strip() for c in citations if len(c.strip()) > 10]
         
-    def _calculate_overlap_score(self, answer: str, chunks: List[str]) -> float:
-        """Calculate text overlap score using TF-IDF cosine similarity."""
+    async def _calculate_overlap_score(self, answer: str, chunks: List[str]) -> float:
+        """Calculate text overlap score using TF-IDF cosine similarity, in the executor."""
         if not chunks:
             return 0.0
             
-        try:
-            all_texts = [answer] + chunks
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
-            
-            # Calculate similarity between answer and each chunk
-            answer_vector = tfidf_matrix[0]
-            chunk_vectors = tfidf_matrix[1:]
-            
-            similarities = cosine_similarity(answer_vector, chunk_vectors)[0]
-            
-            # Return maximum similarity
-            return float(np.max(similarities)) if len(similarities) > 0 else 0.0
-            
-        except Exception as e:
-            logger.warning(f"Error calculating overlap score: {e}")
-            return 0.0
+        # Fit a fresh copy so concurrent calls don't share a fitted vocabulary
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _tfidf_overlap, clone(self.vectorizer), answer, chunks
+        )
             
     def _calculate_citation_score(self, answer: str, chunks: List[str]) -> float:
         """Calculate score based on citation overlap."""
@@ -117,7 +137,7 @@ class GroundingScorer(BaseScorer):
             chunk_texts.append(text)
             
         # Calculate overlap and citation scores
-        overlap_score = self._calculate_overlap_score(answer, chunk_texts)
+        overlap_score = await self._calculate_overlap_score(answer, chunk_texts)
         citation_score = self._calculate_citation_score(answer, chunk_texts)
         
         # Combine scores (weighted average)
@@ -146,11 +166,12 @@ class HelpfulnessScorer(BaseScorer):
     def __init__(self, 
                  api_key: str = None, 
                  model: str = "gpt-3.5-turbo",
-                 api_base: str = "https://api.openai.com/v1"):
+                 api_base: str = "https://api.openai.com/v1",
+                 client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
         self.model = model
         self.api_base = api_base.rstrip('/')
-        self.client = httpx.AsyncClient()
+        self.client = client or httpx.AsyncClient()
         
     async def score(self, 
                    answer: str, 
@@ -283,10 +304,13 @@ class SafetyScorer(BaseScorer):
     Evaluates safety of the answer using content moderation.
     """
     
-    def __init__(self, api_key: str = None, api_base: str = "https://api.openai.com/v1"):
+    def __init__(self, 
+                 api_key: str = None, 
+                 api_base: str = "https://api.openai.com/v1",
+                 client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
         self.api_base = api_base.rstrip('/')
-        self.client = httpx.AsyncClient()
+        self.client = client or httpx.AsyncClient()
         
         # Keyword-based safety checks as fallback
         self.unsafe_patterns = [
@@ -390,10 +414,34 @@ class CompositeScorer:
     def __init__(self, 
                  grounding_scorer: GroundingScorer = None,
                  helpfulness_scorer: HelpfulnessScorer = None,
-                 safety_scorer: SafetyScorer = None):
+                 safety_scorer: SafetyScorer = None,
+                 client: Optional[httpx.AsyncClient] = None):
         self.grounding_scorer = grounding_scorer or GroundingScorer()
-        self.helpfulness_scorer = helpfulness_scorer or HelpfulnessScorer()
-        self.safety_scorer = safety_scorer or SafetyScorer()
+        self.helpfulness_scorer = helpfulness_scorer or HelpfulnessScorer(client=client)
+        self.safety_scorer = safety_scorer or SafetyScorer(client=client)
+        # Scorers' own clients while a shared one is attached via set_client
+        self._own_clients = None
+        
+    def set_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """
+        Send LLM and moderation calls through a shared HTTP client.
+        
+        Passing None detaches it and restores the scorers' own clients.
+        """
+        if client is None:
+            if self._own_clients is not None:
+                self.helpfulness_scorer.client, self.safety_scorer.client = self._own_clients
+                self._own_clients = None
+            return
+            
+        if self._own_clients is None:
+            self._own_clients = (self.helpfulness_scorer.client, self.safety_scorer.client)
+        self.helpfulness_scorer.client = client
+        self.safety_scorer.client = client
+        
+    def set_executor(self, executor: Optional[Executor]) -> None:
+        """Run CPU-bound scoring in the given executor (None for the default thread pool)."""
+        self.grounding_scorer.executor = executor
         
     async def score(self, 
                    answer: str,
@@ -0,0 +1,109 @@
+"""Tests for the tracer's batched background submission."""
+
+import time
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from ragtoolkit.sdk.tracer import RAGTracker, TraceData
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = ""
+
+
+class FakeSession:
+    """Stands in for the flusher's httpx.Client, recording each POST."""
+
+    def __init__(self, status_code=201, error=None, delay=0.0):
+        self.status_code = status_code
+        self.error = error
+        self.delay = delay
+        self.posts = []
+
+    def post(self, url, content, headers, timeout):
+        self.posts.append(content)
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return FakeResponse(self.status_code)
+
+
+class Unserializable:
+    def __deepcopy__(self, memo):
+        raise TypeError("cannot copy")
+
+
+def make_tracker(session, **kwargs):
+    tracker = RAGTracker(api_url="http://collector", api_key="key", project="test", **kwargs)
+    tracker._batch_session = session
+    return tracker
+
+
+def test_flush_submits_in_batches():
+    session = FakeSession()
+    tracker = make_tracker(session, batch_size=2)
+    tracker._queue.extend(TraceData() for _ in range(5))
+
+    assert tracker.flush() == 5
+    assert len(session.posts) == 3
+    assert tracker.dropped_traces == 0
+
+
+def test_failed_batches_count_as_dropped():
+    tracker = make_tracker(FakeSession(status_code=500), batch_size=2)
+    tracker._queue.extend(TraceData() for _ in range(3))
+    assert tracker.flush() == 0
+    assert tracker.dropped_traces == 3
+
+    tracker = make_tracker(FakeSession(error=ConnectionError("unreachable")), batch_size=2)
+    tracker._queue.extend(TraceData() for _ in range(3))
+    assert tracker.flush() == 0
+    assert tracker.dropped_traces == 3
+
+
+def test_unserializable_trace_is_dropped_alone():
+    session = FakeSession()
+    tracker = make_tracker(session)
+    tracker._queue.extend([TraceData(), TraceData(metadata={"bad": Unserializable()}), TraceData()])
+
+    assert tracker.flush() == 2
+    assert tracker.dropped_traces == 1
+    assert len(session.posts) == 1
+
+
+def test_full_queue_drops_instead_of_blocking():
+    tracker = make_tracker(FakeSession(), max_queue_size=1)
+    tracker._flusher = object()  # Keep enqueue from starting a real flusher
+
+    assert tracker.enqueue_trace(TraceData())
+    assert not tracker.enqueue_trace(TraceData())
+    assert tracker.dropped_traces == 1
+
+
+def test_exit_flush_is_bounded():
+    session = FakeSession(delay=0.2)
+    tracker = make_tracker(session, batch_size=1)
+    tracker.EXIT_FLUSH_TIMEOUT = 0.3
+    tracker._queue.extend(TraceData() for _ in range(10))
+
+    started = time.monotonic()
+    tracker._flush_at_exit()
+
+    assert time.monotonic() - started < 1.0
+    assert len(session.posts) == 2
+    assert tracker.dropped_traces == 8
+    assert not tracker._queue
+
+
+def test_traces_with_int_keys_and_big_ints_are_submitted():
+    session = FakeSession()
+    tracker = make_tracker(session)
+    tracker._queue.extend([TraceData(metadata={1: "one"}), TraceData(metadata={"big": 2 ** 70})])
+
+    assert tracker.flush() == 2
+    assert tracker.dropped_traces == 0
+    assert b'"1":"one"' in session.posts[0].replace(b" ", b"")
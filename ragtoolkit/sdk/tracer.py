@@ -6,9 +6,13 @@ including user input, retrieved chunks, model outputs, and metadata.
 """
 
 import asyncio
+import atexit
+import contextvars
 import json
+import random
 import time
 import uuid
+from collections import deque
 from contextlib import contextmanager
 from functools import wraps
 from typing import Any, Dict, List, Optional, Union
@@ -20,6 +24,19 @@ import httpx
 
 from ..config import get_config
 
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # What orjson still rejects but json accepts, e.g. ints beyond 64 bits
+            return json.dumps(obj).encode()
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,10 +59,25 @@ class TraceData:
     error: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class TrackerConfig:
+    """Resolved global tracker settings, replaced wholesale by configure_tracker."""
+    api_url: str
+    project: str
+    api_key: Optional[str] = None
+    enabled: bool = True
+    batch_size: int = 32
+    flush_interval: float = 0.1
+
+
 class RAGTracker:
     """Main tracker class for managing RAG traces."""
     
-    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None, project: Optional[str] = None):
+    # Seconds the interpreter-exit flush may spend before dropping the rest
+    EXIT_FLUSH_TIMEOUT = 2.0
+    
+    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None, project: Optional[str] = None,
+                 batch_size: int = 32, flush_interval: float = 0.1, max_queue_size: int = 10_000):
         # Load configuration
         config = get_config()
         
@@ -53,7 +85,24 @@ class RAGTracker:
         self.api_key = api_key or config.token
         self.project = project or config.project
         self.session = httpx.AsyncClient()
-        self._current_trace = threading.local()
+        # Context-local so concurrent asyncio tasks don't share a trace
+        self._current_trace: contextvars.ContextVar[Optional[TraceData]] = contextvars.ContextVar(
+            f"ragtoolkit_current_trace_{id(self)}", default=None
+        )
+        
+        # Buffered submission: traces are queued and POSTed in batches by a
+        # daemon thread so the traced call never waits on the collector
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.dropped_traces = 0
+        self._queue: deque = deque()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = threading.Event()
+        self._flusher_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._dropped_lock = threading.Lock()
+        self._batch_session: Optional[httpx.Client] = None
     
     @classmethod
     def get_current_tracker(cls) -> Optional['RAGTracker']:
@@ -69,13 +118,13 @@ class RAGTracker:
         
     @property
     def current_trace(self) -> Optional[TraceData]:
-        """Get current trace data for this thread."""
-        return getattr(self._current_trace, 'data', None)
+        """Get current trace data for this thread or asyncio task."""
+        return self._current_trace.get()
     
     @current_trace.setter
     def current_trace(self, trace_data: Optional[TraceData]):
-        """Set current trace data for this thread."""
-        self._current_trace.data = trace_data
+        """Set current trace data for this thread or asyncio task."""
+        self._current_trace.set(trace_data)
         
     def start_trace(self, user_input: str = None, **metadata) -> TraceData:
         """Start a new trace."""
@@ -132,7 +181,7 @@ class RAGTracker:
                 
             response = await self.session.post(
                 f"{self.api_url}/api/v1/traces",
-                json=asdict(trace_data),
+                content=_dumps(asdict(trace_data)),
                 headers=self._get_headers(),
                 timeout=5.0
             )
@@ -152,6 +201,137 @@ class RAGTracker:
         """Submit trace synchronously."""
         return asyncio.run(self.submit_trace(trace_data))
         
+    def enqueue_trace(self, trace_data: TraceData) -> bool:
+        """
+        Queue a trace for batched background submission.
+        
+        Never blocks: when the queue is full the trace is dropped and
+        counted in ``dropped_traces``.
+        """
+        if len(self._queue) >= self.max_queue_size:
+            self._count_dropped(1)
+            return False
+            
+        self._queue.append(trace_data)
+        if self._flusher is None:
+            self._start_flusher()
+        return True
+        
+    def _count_dropped(self, count: int):
+        """Add traces that will never be submitted to ``dropped_traces``."""
+        with self._dropped_lock:
+            self.dropped_traces += count
+        
+    def _start_flusher(self):
+        """Start the background flusher thread once."""
+        with self._flusher_lock:
+            if self._flusher is not None:
+                return
+            self._batch_session = httpx.Client(timeout=5.0)
+            self._flusher_stop = threading.Event()
+            self._flusher = threading.Thread(
+                target=self._flush_loop, args=(self._flusher_stop,), name="ragtoolkit-flusher", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self._flush_at_exit)
+            
+    def _flush_loop(self, stop: threading.Event):
+        """Periodically drain the trace queue until stop is set."""
+        while not stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                # Keep the flusher alive; a dead one would let the queue fill up
+                logger.error(f"Error flushing traces: {e}")
+                
+    def close(self):
+        """
+        Stop the background flusher and submit what is queued.
+        
+        Like the flush at interpreter exit, submission gives up after
+        EXIT_FLUSH_TIMEOUT seconds and drops what is left. Traces enqueued
+        afterwards start a new flusher.
+        """
+        with self._flusher_lock:
+            flusher, self._flusher = self._flusher, None
+            if flusher is None:
+                return
+            self._flusher_stop.set()
+            atexit.unregister(self._flush_at_exit)
+        flusher.join(timeout=self.EXIT_FLUSH_TIMEOUT)
+        self._flush_at_exit()
+        self._batch_session.close()
+            
+    def _flush_at_exit(self):
+        """Flush for up to EXIT_FLUSH_TIMEOUT seconds, dropping what is left."""
+        self.flush(timeout=self.EXIT_FLUSH_TIMEOUT)
+        with self._flush_lock:
+            remaining = len(self._queue)
+            self._queue.clear()
+        if remaining:
+            self._count_dropped(remaining)
+            logger.warning(f"Dropped {remaining} queued traces at exit")
+            
+    def flush(self, timeout: Optional[float] = None) -> int:
+        """
+        Submit queued traces in batches of ``batch_size``.
+        
+        Args:
+            timeout: Seconds to keep submitting; traces still queued when it
+                runs out stay queued. None drains the whole queue.
+        
+        Returns:
+            Number of traces accepted by the API
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        submitted = 0
+        while True:
+            request_timeout = 5.0
+            if deadline is not None:
+                request_timeout = min(request_timeout, deadline - time.monotonic())
+                if request_timeout <= 0:
+                    break
+                    
+            # Take the batch under the lock but serialize and POST outside
+            # it, so one slow request doesn't hold up other flushes
+            with self._flush_lock:
+                traces = []
+                while self._queue and len(traces) < self.batch_size:
+                    traces.append(self._queue.popleft())
+            if not traces:
+                break
+                
+            # A trace that can't be serialized is dropped on its own
+            batch = []
+            for trace_data in traces:
+                try:
+                    batch.append(_dumps(asdict(trace_data)))
+                except Exception as e:
+                    self._count_dropped(1)
+                    logger.error(f"Error serializing trace {trace_data.trace_id}: {e}")
+            if not batch:
+                continue
+                
+            try:
+                response = self._batch_session.post(
+                    f"{self.api_url}/api/v1/traces/batch",
+                    content=b"[" + b",".join(batch) + b"]",
+                    headers=self._get_headers(),
+                    timeout=request_timeout
+                )
+                
+                if response.status_code == 201:
+                    submitted += len(batch)
+                else:
+                    self._count_dropped(len(batch))
+                    logger.error(f"Failed to submit trace batch: {response.status_code} - {response.text}")
+                    
+            except Exception as e:
+                self._count_dropped(len(batch))
+                logger.error(f"Error submitting trace batch: {e}")
+                
+        return submitted
+        
     @contextmanager
     def trace_context(self, user_input: str = None, **metadata):
         """Context manager for tracing RAG operations."""
@@ -166,15 +346,20 @@ class RAGTracker:
         finally:
             trace_data.response_latency_ms = (time.time() - start_time) * 1000
             
-            # Submit trace async in background
-            asyncio.create_task(self.submit_trace(trace_data))
+            # Hand off to the background flusher
+            self.enqueue_trace(trace_data)
             
             # Clear current trace
             self.current_trace = None
 
 
-# Global tracker instance
+# Global tracker instance and the configuration it was built from; every
+# @trace wrapper reads _CONFIG once per call, None meaning tracing defaults
 _global_tracker = None
+_CONFIG: Optional[TrackerConfig] = None
+
+# Per-process sampler for @trace head sampling
+_sampler = random.Random()
 
 
 def get_global_tracker() -> RAGTracker:
@@ -185,19 +370,66 @@ def get_global_tracker() -> RAGTracker:
     return _global_tracker
 
 
-def configure_tracker(api_url: Optional[str] = None, api_key: Optional[str] = None, project: Optional[str] = None):
-    """Configure the global tracker instance."""
-    global _global_tracker
-    _global_tracker = RAGTracker(api_url=api_url, api_key=api_key, project=project)
+def get_tracker_config() -> Optional[TrackerConfig]:
+    """Get the configuration set by the last configure_tracker call."""
+    return _CONFIG
+
 
+def configure_tracker(api_url: Optional[str] = None, api_key: Optional[str] = None, project: Optional[str] = None,
+                      prewarm: Optional[List[str]] = None, enabled: bool = True,
+                      batch_size: int = 32, flush_interval: float = 0.1) -> TrackerConfig:
+    """
+    Configure the global tracker instance.
+    
+    Args:
+        api_url: RAG Toolkit API URL
+        api_key: API key for the RAG Toolkit API
+        project: Project name
+        prewarm: LLM providers ("openai" and/or "anthropic") whose
+            TLS connections are opened in the background so the first traced
+            call skips the handshake
+        enabled: When False, @trace-decorated functions call straight through
+            with no trace capture
+        batch_size: Maximum traces per background submission request
+        flush_interval: Seconds between background flushes
+        
+    Returns:
+        The resolved, immutable tracker configuration
+    """
+    global _global_tracker, _CONFIG
+    # The replaced tracker's flusher would otherwise poll forever
+    if _global_tracker is not None:
+        _global_tracker.close()
+    tracker = RAGTracker(api_url=api_url, api_key=api_key, project=project,
+                         batch_size=batch_size, flush_interval=flush_interval)
+    _CONFIG = TrackerConfig(
+        api_url=tracker.api_url,
+        project=tracker.project,
+        api_key=tracker.api_key,
+        enabled=enabled,
+        batch_size=batch_size,
+        flush_interval=flush_interval
+    )
+    _global_tracker = tracker
+    
+    if prewarm:
+        from .connectors.pool import prewarm_connections
+        prewarm_connections(prewarm)
+        
+    return _CONFIG
 
-def trace(func=None, *, user_input_key: str = None, output_key: str = None):
+
+def trace(func=None, *, user_input_key: str = None, output_key: str = None,
+          sample_rate: float = 1.0, always_sample_errors: bool = True):
     """
     Decorator to automatically trace RAG function calls.
     
     Args:
         user_input_key: Key to extract user input from function args/kwargs
         output_key: Key to extract output from function result
+        sample_rate: Fraction of calls to trace (head sampling). Unsampled
+            calls run the bare function with no trace capture or submission.
+        always_sample_errors: Still record a trace when an unsampled call raises
         
     Usage:
         @trace
@@ -209,67 +441,85 @@ def trace(func=None, *, user_input_key: str = None, output_key: str = None):
         def my_rag_pipeline(question: str) -> dict:
             # Your RAG logic here
             return {"answer": "...", "sources": [...]}
+            
+        @trace(sample_rate=0.1)
+        def my_high_volume_pipeline(query: str) -> str:
+            ...
     """
     
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Extract user input
-            user_input = None
+        name = func.__name__
+        sampled = sample_rate < 1.0
+        
+        def extract_user_input(args, kwargs):
             if user_input_key and user_input_key in kwargs:
-                user_input = kwargs[user_input_key]
+                return kwargs[user_input_key]
             elif len(args) > 0:
-                user_input = str(args[0])
-                
-            with get_global_tracker().trace_context(user_input=user_input, function=func.__name__) as trace:
-                start_time = time.time()
+                return str(args[0])
+            return None
+            
+        def extract_output(result):
+            if output_key and isinstance(result, dict) and output_key in result:
+                return result[output_key]
+            return str(result)
+            
+        def record_unsampled_error(args, kwargs, error):
+            tracker = get_global_tracker()
+            with tracker.trace_context(user_input=extract_user_input(args, kwargs), function=name):
+                tracker.set_error(str(error))
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            __tracebackhide__ = True  # Fold this frame in pytest/profiler tracebacks
+            config = _CONFIG
+            if config is not None and not config.enabled:
+                return func(*args, **kwargs)
                 
+            if sampled and _sampler.random() >= sample_rate:
+                if not always_sample_errors:
+                    return func(*args, **kwargs)
                 try:
-                    result = func(*args, **kwargs)
-                    
-                    # Extract output
-                    output = None
-                    if output_key and isinstance(result, dict) and output_key in result:
-                        output = result[output_key]
-                    else:
-                        output = str(result)
-                        
-                    get_global_tracker().set_model_output(output)
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    record_unsampled_error(args, kwargs, e)
+                    raise
                     
+            tracker = _global_tracker or get_global_tracker()
+            with tracker.trace_context(user_input=extract_user_input(args, kwargs), function=name):
+                try:
+                    result = func(*args, **kwargs)
+                    tracker.set_model_output(extract_output(result))
                     return result
                     
                 except Exception as e:
-                    get_global_tracker().set_error(str(e))
+                    tracker.set_error(str(e))
                     raise
                     
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Extract user input
-            user_input = None
-            if user_input_key and user_input_key in kwargs:
-                user_input = kwargs[user_input_key]
-            elif len(args) > 0:
-                user_input = str(args[0])
-                
-            with get_global_tracker().trace_context(user_input=user_input, function=func.__name__) as trace:
-                start_time = time.time()
+            __tracebackhide__ = True  # Fold this frame in pytest/profiler tracebacks
+            config = _CONFIG
+            if config is not None and not config.enabled:
+                return await func(*args, **kwargs)
                 
+            if sampled and _sampler.random() >= sample_rate:
+                if not always_sample_errors:
+                    return await func(*args, **kwargs)
                 try:
-                    result = await func(*args, **kwargs)
-                    
-                    # Extract output
-                    output = None
-                    if output_key and isinstance(result, dict) and output_key in result:
-                        output = result[output_key]
-                    else:
-                        output = str(result)
-                        
-                    get_global_tracker().set_model_output(output)
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    record_unsampled_error(args, kwargs, e)
+                    raise
                     
+            tracker = _global_tracker or get_global_tracker()
+            with tracker.trace_context(user_input=extract_user_input(args, kwargs), function=name):
+                try:
+                    result = await func(*args, **kwargs)
+                    tracker.set_model_output(extract_output(result))
                     return result
                     
                 except Exception as e:
-                    get_global_tracker().set_error(str(e))
+                    tracker.set_error(str(e))
                     raise
                     
         # Return appropriate wrapper based on function type
@@ -38,6 +38,8 @@ setup(
         "httpx>=0.25.0",
         "sqlalchemy>=2.0.0",
         "psycopg2-binary>=2.9.0",
+        "aiosqlite>=0.19.0",
+        "asyncpg>=0.29.0",
         "numpy>=1.24.0",
         "scikit-learn>=1.3.0",
         "typer>=0.9.0",
@@ -58,6 +60,9 @@ setup(
             "openai>=1.0.0",
             "anthropic>=0.3.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [